@@ -21,7 +21,6 @@ from datetime import datetime
 from functools import lru_cache
 from pathlib import Path, PurePath, PurePosixPath, PureWindowsPath
 from typing import Any, Mapping
-from xml.sax.saxutils import escape as _xml_escape
 import xml.etree.ElementTree as ET
 
 # Local imports
@@ -67,7 +66,39 @@ def xml_escape(data: str) -> str:
     """Escape &, <, >, \", and ' for safe use in XML."""
     if data is None:
         return ""
-    return _xml_escape(data, {'"': "&quot;", "'": "&apos;"})
+    # A plain chain of str.replace calls; "&" must come first
+    return (
+        data.replace("&", "&amp;")
+        .replace("<", "&lt;")
+        .replace(">", "&gt;")
+        .replace('"', "&quot;")
+        .replace("'", "&apos;")
+    )
+
+
+@lru_cache(maxsize=4096)
+def _xml_escape_attr(data: str) -> str:
+    """Return ``xml_escape(data)``, caching results for repeated attribute values.
+
+    Header and footer templates escape the same file name, extension, stem,
+    directory, and language, and directories and extensions repeat across files.
+    """
+    return xml_escape(data)
+
+
+# Size of the slices written by ``_write_xml_escaped``
+_XML_WRITE_CHUNK_SIZE = 64 * 1024
+
+
+def _write_xml_escaped(outfile, data: str) -> None:
+    """Escape ``data`` for XML and write it to ``outfile`` in slices.
+
+    Escaping one slice at a time keeps a second, fully escaped copy of large
+    files out of memory. Every escaped character maps to its own entity, so
+    the slice boundaries never change the result.
+    """
+    for start in range(0, len(data), _XML_WRITE_CHUNK_SIZE):
+        outfile.write(xml_escape(data[start:start + _XML_WRITE_CHUNK_SIZE]))
 
 
 def _to_int_or_none(val: Any) -> int | None:
@@ -546,6 +577,18 @@ def _construct_git_web_url(remote_url, commit_or_branch, relative_path=None):
     return None
 
 
+@lru_cache(maxsize=256)
+def _placeholder_pattern(keys):
+    """Return a search pattern that matches any of the placeholder ``keys``.
+
+    The same set of placeholders is used for every file, so the pattern is
+    built once and reused for each header and footer.
+    """
+    # Sort keys by length descending to prevent partial prefix matching
+    sorted_keys = sorted(keys, key=len, reverse=True)
+    return re.compile("|".join(re.escape(k) for k in sorted_keys))
+
+
 def _render_single_pass(template, replacements):
     """Replace many placeholders in a template in a single pass.
 
@@ -556,9 +599,7 @@ def _render_single_pass(template, replacements):
     if not template or not replacements:
         return template or ""
 
-    # Sort keys by length descending to prevent partial prefix matching
-    sorted_keys = tuple(sorted(replacements.keys(), key=len, reverse=True))
-    pattern = re.compile("|".join(re.escape(k) for k in sorted_keys))
+    pattern = _placeholder_pattern(tuple(replacements))
     return pattern.sub(
         lambda m: str(replacements[m.group(0)]) if replacements[m.group(0)] is not None else "",
         template
@@ -791,6 +832,12 @@ def _matches_folder_glob_cached(parts, patterns):
     return False
 
 
+@lru_cache(maxsize=256)
+def _compile_grep_pattern(pattern):
+    """Compile a ``grep``/``exclude_grep`` filter once and reuse it for every file."""
+    return re.compile(pattern)
+
+
 def should_include(
     file_path: Path | None,
     relative_path: PurePath,
@@ -948,10 +995,10 @@ def should_include(
             else:
                 content = ""
 
-            if grep_pattern and not re.search(grep_pattern, content):
+            if grep_pattern and not _compile_grep_pattern(grep_pattern).search(content):
                 return (False, 'grep_mismatch') if return_reason else False
 
-            if exclude_grep_pattern and re.search(exclude_grep_pattern, content):
+            if exclude_grep_pattern and _compile_grep_pattern(exclude_grep_pattern).search(content):
                 return (False, 'exclude_grep_match') if return_reason else False
 
             if min_tokens > 0 or max_tokens > 0:
@@ -1373,7 +1420,8 @@ def collect_file_paths(root_folder, recursive, exclude_folders, progress=None, m
     if recursive:
         try:
             for dirpath, dirnames, filenames in os.walk(root_path):
-                rel_dir = Path(dirpath).relative_to(root_path)
+                dir_path = Path(dirpath)
+                rel_dir = dir_path.relative_to(root_path)
                 current_depth = len(rel_dir.parts)
 
                 if max_depth > 0 and current_depth >= max_depth:
@@ -1393,7 +1441,7 @@ def collect_file_paths(root_folder, recursive, exclude_folders, progress=None, m
                 filenames.sort()
 
                 for name in filenames:
-                    file_paths.append(Path(dirpath) / name)
+                    file_paths.append(dir_path / name)
                     progress.update(1)
         except OSError as exc:
             logging.warning(
@@ -1403,14 +1451,17 @@ def collect_file_paths(root_folder, recursive, exclude_folders, progress=None, m
             )
     else:
         try:
-            entries = sorted(root_path.iterdir(), key=lambda e: e.name)
+            # DirEntry caches the file type from the directory listing, so
+            # this avoids a stat call per entry
+            with os.scandir(root_path) as it:
+                entries = sorted(it, key=lambda e: e.name)
             for entry in entries:
                 if entry.is_dir():
-                    if _folder_is_excluded(entry.relative_to(root_path)):
+                    if _folder_is_excluded(Path(entry.name)):
                         excluded_folder_count += 1
                         continue
                 if entry.is_file():
-                    file_paths.append(entry)
+                    file_paths.append(root_path / entry.name)
                     progress.update(1)
         except OSError as exc:
             logging.warning(
@@ -1964,7 +2015,7 @@ class FileProcessor:
         self.output_format = output_format
         self.skip_content = bool(self.output_opts.get('skip_content', False))
         self.show_diff = bool(self.output_opts.get('show_diff', False))
-        self.processing_opts = config.get('processing', {}) or {}
+        self.processing_opts = utils.compile_options(config.get('processing', {}) or {})
         self.apply_in_place = bool(self.processing_opts.get('apply_in_place'))
         if self.apply_in_place:
             self.create_backups = bool(
@@ -1979,7 +2030,10 @@ class FileProcessor:
         return _progress_bar(enabled=_progress_enabled(self.dry_run), **kwargs)
 
     def _write_with_templates(self, outfile, content, relative_path, size=None, tokens=None, lines=None, modified=None, index=None, total=None, global_size=None, global_tokens=None, global_lines=None, file_path=None, language=None, sha256=None):
-        """Write ``content`` with configured header/footer templates."""
+        """Write ``content`` with configured header/footer templates.
+
+        For XML output the content is escaped while it is being written.
+        """
 
         header_template = self.output_opts.get(
             'header_template', utils.DEFAULT_CONFIG['output']['header_template']
@@ -1988,7 +2042,7 @@ class FileProcessor:
             'footer_template', utils.DEFAULT_CONFIG['output']['footer_template']
         )
 
-        escape_func = xml_escape if self.output_format == 'xml' else None
+        escape_func = _xml_escape_attr if self.output_format == 'xml' else None
 
         if self.output_format not in ("json", "jsonl", "manifest", "csv"):
             outfile.write(_render_template(
@@ -1998,7 +2052,10 @@ class FileProcessor:
                 global_size=global_size, global_tokens=global_tokens, global_lines=global_lines,
                 git_info=self.git_info, file_path=file_path, language=language, sha256=sha256
             ))
-        outfile.write(content)
+        if self.output_format == "xml":
+            _write_xml_escaped(outfile, content)
+        else:
+            outfile.write(content)
         if self.output_format not in ("json", "jsonl", "manifest", "csv"):
             outfile.write(_render_template(
                 footer_template, relative_path, size=size, tokens=tokens, lines=lines,
@@ -2109,8 +2166,6 @@ class FileProcessor:
         else:
             if include_line_numbers and self.output_opts.get("add_line_numbers", False):
                 content = add_line_numbers(content)
-            if self.output_format == "xml":
-                content = xml_escape(content)
             self._write_with_templates(
                 outfile,
                 content,
@@ -2266,34 +2321,46 @@ def _generate_tree_string(paths, root_path, output_format='text', include_header
         # Fallback if any path is not relative to root (should ideally not happen)
         rel_paths = paths
 
-    # Map relative paths back to original paths for information lookup
-    rel_to_orig = {p_rel: p_orig for p_rel, p_orig in zip(rel_paths, paths)}
+    # Map relative path parts back to original paths for information lookup
+    rel_to_orig = {p_rel.parts: p_orig for p_rel, p_orig in zip(rel_paths, paths)}
 
     # Build the tree dictionary
     # { 'folder': { 'subfolder': { 'file.txt': {} } } }
     tree = {}
-    for p in rel_paths:
-        parts = p.parts
+    for parts in rel_to_orig:
         current = tree
         for part in parts:
-            if part not in current:
-                current[part] = {}
-            current = current[part]
+            current = current.setdefault(part, {})
 
-    # Pre-calculate folder-level statistics
+    # Pre-calculate folder-level statistics in one bottom-up pass, keyed by
+    # the folder's path parts. Each folder sums the totals of its direct
+    # children, so no file is visited more than once.
     folder_information = {}
+
+    def _aggregate(node, rel_parts):
+        totals = {'size': 0, 'tokens': 0, 'lines': 0, 'files': 0}
+        for name, children in node.items():
+            child_parts = rel_parts + (name,)
+            if children:
+                child_totals = _aggregate(children, child_parts)
+            else:
+                file_meta = information.get(rel_to_orig[child_parts])
+                child_totals = file_meta and {
+                    'size': file_meta.get('size') or 0,
+                    'tokens': file_meta.get('tokens') or 0,
+                    'lines': file_meta.get('lines') or 0,
+                    'files': 1,
+                }
+            if child_totals:
+                for key in totals:
+                    totals[key] += child_totals[key]
+        if not totals['files']:
+            return None
+        folder_information[rel_parts] = totals
+        return totals
+
     if information:
-        for rel_p, orig_p in rel_to_orig.items():
-            file_meta = information.get(orig_p)
-            if not file_meta:
-                continue
-            for parent in rel_p.parents:
-                if parent not in folder_information:
-                    folder_information[parent] = {'size': 0, 'tokens': 0, 'lines': 0, 'files': 0}
-                folder_information[parent]['size'] += (file_meta.get('size') or 0)
-                folder_information[parent]['tokens'] += (file_meta.get('tokens') or 0)
-                folder_information[parent]['lines'] += (file_meta.get('lines') or 0)
-                folder_information[parent]['files'] += 1
+        _aggregate(tree, ())
 
     lines = []
     if include_header:
@@ -2315,7 +2382,6 @@ def _generate_tree_string(paths, root_path, output_format='text', include_header
             connector = f"{dim}└── {reset}" if is_last else f"{dim}├── {reset}"
 
             current_rel_parts = rel_parts + (item,)
-            current_rel_path = Path(*current_rel_parts)
             children = node[item]
 
             meta_str = ""
@@ -2323,11 +2389,11 @@ def _generate_tree_string(paths, root_path, output_format='text', include_header
                 is_text = (output_format == 'text')
                 if children:
                     # It's a folder - show totals
-                    if current_rel_path in folder_information:
-                        meta_str = f"{dim}{_format_information_summary(folder_information[current_rel_path], colored=is_text)}{reset}"
-                elif current_rel_path in rel_to_orig:
+                    if current_rel_parts in folder_information:
+                        meta_str = f"{dim}{_format_information_summary(folder_information[current_rel_parts], colored=is_text)}{reset}"
+                elif current_rel_parts in rel_to_orig:
                     # It's a file - show individual stats
-                    orig_path = rel_to_orig[current_rel_path]
+                    orig_path = rel_to_orig[current_rel_parts]
                     file_meta = information.get(orig_path)
                     if file_meta:
                         meta_str = f"{dim}{_format_information_summary(file_meta, colored=is_text)}{reset}"
@@ -2343,9 +2409,9 @@ def _generate_tree_string(paths, root_path, output_format='text', include_header
 
     # Add the root folder name first
     root_meta_str = ""
-    if information and Path('.') in folder_information:
+    if information and () in folder_information:
         is_text = (output_format == 'text')
-        root_meta_str = f"{dim}{_format_information_summary(folder_information[Path('.')], colored=is_text)}{reset}"
+        root_meta_str = f"{dim}{_format_information_summary(folder_information[()], colored=is_text)}{reset}"
 
     lines.append(f"{folder_style}{root_path.name or str(root_path)}{dim}/{reset}{root_meta_str}")
     _add_node(tree)
@@ -3335,36 +3401,39 @@ def find_and_combine_files(
                     unit="file",
                 )
                 running_metric = 0
-                for item in all_combined_items:
-                    file_path, root_path, is_excluded_by_size = item
-                    rel_p = _get_rel_path(file_path, root_path)
-                    rel_p_str = rel_p.as_posix()
-                    sort_bar.set_description(f"Analyzing {_truncate_path(rel_p_str, 40)}")
-                    if is_excluded_by_size:
-                        placeholder = output_opts.get('max_size_placeholder')
-                        # Note: 1372-1373 ensures placeholder exists if we are here
-                        rendered = _render_template(
-                            placeholder, rel_p,
-                            size=file_path.stat().st_size if file_path.exists() else 0,
-                            custom_languages=search_opts.get('custom_languages'),
-                            git_info=stats, file_path=file_path
-                        )
-                        if sort_by == 'tokens':
-                            val, _ = utils.estimate_tokens(rendered)
-                        else:
-                            val = utils.count_lines(rendered)
-                    else:
-                        content, _ = read_file_best_effort(file_path)
-                        lang = utils.get_language_tag(file_path, content=content, overrides=processor.custom_languages)
-                        processed = utils.process_content(content, processor.processing_opts, language=lang)
-                        if sort_by == 'tokens':
-                            val, _ = utils.estimate_tokens(processed)
+                metric_values = utils.measure_files(
+                    [item[0] for item in all_combined_items if not item[2]],
+                    sort_by,
+                    processor.processing_opts,
+                    overrides=processor.custom_languages,
+                )
+                try:
+                    for item in all_combined_items:
+                        file_path, root_path, is_excluded_by_size = item
+                        rel_p = _get_rel_path(file_path, root_path)
+                        rel_p_str = rel_p.as_posix()
+                        sort_bar.set_description(f"Analyzing {_truncate_path(rel_p_str, 40)}")
+                        if is_excluded_by_size:
+                            placeholder = output_opts.get('max_size_placeholder')
+                            # Note: 1372-1373 ensures placeholder exists if we are here
+                            rendered = _render_template(
+                                placeholder, rel_p,
+                                size=file_path.stat().st_size if file_path.exists() else 0,
+                                custom_languages=search_opts.get('custom_languages'),
+                                git_info=stats, file_path=file_path
+                            )
+                            if sort_by == 'tokens':
+                                val, _ = utils.estimate_tokens(rendered)
+                            else:
+                                val = utils.count_lines(rendered)
                         else:
-                            val = utils.count_lines(processed)
-                    metric_data.append((val, rel_p_str))
-                    running_metric += val
-                    sort_bar.set_postfix(**{sort_by: f"{running_metric:,}"})
-                    sort_bar.update(1)
+                            val = next(metric_values)
+                        metric_data.append((val, rel_p_str))
+                        running_metric += val
+                        sort_bar.set_postfix(**{sort_by: f"{running_metric:,}"})
+                        sort_bar.update(1)
+                finally:
+                    metric_values.close()
                 sort_bar.close()
 
                 # Sort by metric
@@ -5312,11 +5381,10 @@ def main():
                 if input_path.is_dir():
                     # Batch scan directory for potential combined files
                     paths, _, _ = collect_file_paths(input_path, recursive=True, exclude_folders=[])
-                    for p in paths:
-                        if not _looks_binary(p):
-                            content, _ = read_file_best_effort(p)
-                            if content:
-                                sources.append((str(p), content))
+                    text_paths = [p for p in paths if not _looks_binary(p)]
+                    for p, (content, _) in zip(text_paths, utils.read_files_best_effort(text_paths)):
+                        if content:
+                            sources.append((str(p), content))
                 elif input_path.is_file():
                     content, _ = read_file_best_effort(input_path)
                     sources.append((str(input_path), content))
@@ -0,0 +1,40 @@
+import sys
+from pathlib import Path
+
+import pytest
+import yaml
+
+# Make the project modules importable from every test module
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_cmdline_main(config):
+    """Spread the suite over all CPUs when pytest-xdist is installed.
+
+    Tests only touch their own ``tmp_path``, so they can run in any order. An
+    explicit ``-n``/``--dist`` on the command line (``-n 0`` to stay serial)
+    takes precedence, and ``--pdb`` sessions keep running in-process.
+    """
+    if not config.pluginmanager.hasplugin("xdist") or hasattr(config, "workerinput"):
+        return
+    if config.option.numprocesses is None and not config.option.usepdb:
+        config.option.numprocesses = "auto"
+        if config.option.dist == "no":
+            config.option.dist = "worksteal"
+
+
+# Prefer the libyaml-backed dumper when PyYAML was built with it
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+@pytest.fixture
+def write_config(tmp_path):
+    """Return a helper that writes a configuration dictionary to a YAML file."""
+
+    def _write(data, name="config.yml"):
+        path = tmp_path / name
+        path.write_text(yaml.dump(data, Dumper=_YAML_DUMPER), encoding="utf-8")
+        return path
+
+    return _write
@@ -1,13 +1,7 @@
-import sys; import os; from pathlib import Path; sys.path.insert(0, os.fspath(Path(__file__).resolve().parent.parent))
-
-import sys
 import unittest
 from unittest.mock import patch, MagicMock
-from pathlib import Path
 import argparse
 
-# Add current directory to sys.path to import sourcecombine
-sys.path.append(str(Path(__file__).parent.parent))
 import sourcecombine
 
 class TestAIPreset(unittest.TestCase):
@@ -1,11 +1,6 @@
-import sys; import os; from pathlib import Path; sys.path.insert(0, os.fspath(Path(__file__).resolve().parent.parent))
-
 import os
-import sys
 from pathlib import Path
 
-# Ensure we can import sourcecombine from parent directory
-
 from sourcecombine import _select_preferred_path
 
 def test_select_preferred_path_skips_ambiguity():
@@ -1,5 +1,3 @@
-import sys; import os; from pathlib import Path; sys.path.insert(0, os.fspath(Path(__file__).resolve().parent.parent))
-
 import unittest
 from unittest.mock import patch, MagicMock
 import argparse
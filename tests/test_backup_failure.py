@@ -1,14 +1,9 @@
-import sys; import os; from pathlib import Path; sys.path.insert(0, os.fspath(Path(__file__).resolve().parent.parent))
 import utils
 
-import os
-import sys
-from pathlib import Path
 from unittest.mock import patch, MagicMock
 
 import pytest
 
-# Add the project root to sys.path so we can import sourcecombine
 
 from sourcecombine import FileProcessor
 
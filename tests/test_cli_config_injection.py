@@ -1,4 +1,3 @@
-import sys; import os; from pathlib import Path; sys.path.insert(0, os.fspath(Path(__file__).resolve().parent.parent))
 import utils
 
 import sys
@@ -8,7 +7,6 @@ from pathlib import Path
 from unittest.mock import patch, MagicMock
 import pytest
 
-# Adjust sys.path to include the project root
 
 from sourcecombine import main, find_and_combine_files, _generate_tree_string
 
@@ -1,4 +1,3 @@
-import sys; import os; from pathlib import Path; sys.path.insert(0, os.fspath(Path(__file__).resolve().parent.parent))
 import utils
 
 import sys
@@ -10,7 +9,6 @@ from unittest.mock import patch
 import pytest
 import yaml
 
-# Adjust sys.path to include the project root
 
 from sourcecombine import main, utils
 
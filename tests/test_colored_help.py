@@ -1,11 +1,6 @@
-import sys
-import os
 import argparse
-from pathlib import Path
 from unittest.mock import patch, MagicMock
 
-sys.path.insert(0, os.fspath(Path(__file__).resolve().parent.parent))
-
 from sourcecombine import ColoredHelpFormatter
 
 def test_colored_help_formatter_heading_coloring():
@@ -1,4 +1,4 @@
-import sys; import os; from pathlib import Path; sys.path.insert(0, os.fspath(Path(__file__).resolve().parent.parent))
+from pathlib import Path
 import utils
 from sourcecombine import should_include
 from unittest.mock import patch
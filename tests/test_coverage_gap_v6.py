@@ -1,8 +1,5 @@
-import sys; import os; from pathlib import Path; sys.path.insert(0, os.fspath(Path(__file__).resolve().parent.parent))
 import utils
 
-import os
-import sys
 import pytest
 import importlib
 from pathlib import Path
@@ -1,4 +1,4 @@
-import sys; import os; from pathlib import Path; sys.path.insert(0, os.fspath(Path(__file__).resolve().parent.parent))
+import sys
 from sourcecombine import _process_paired_files, extract_files, main
 import pytest
 import logging
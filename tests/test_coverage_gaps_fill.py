@@ -1,16 +1,8 @@
-import sys; import os; from pathlib import Path; sys.path.insert(0, os.fspath(Path(__file__).resolve().parent.parent))
 import utils
 
-import os
-import sys
-from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 
-# Adjust sys.path to include the project root
-
-
-
 def test_truncate_path_short_width():
     # Covers sourcecombine.py line 211
     from sourcecombine import _truncate_path
@@ -1,14 +1,9 @@
-import sys
-import os
 import io
 import csv
 import logging
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
-# Adjust sys.path to include the project root
-sys.path.insert(0, os.fspath(Path(__file__).resolve().parent.parent))
-
 import sourcecombine
 import utils
 
@@ -1,14 +1,8 @@
-import sys
-import os
-from pathlib import Path
 from unittest.mock import MagicMock, patch
 import pytest
 import logging
 import copy
 
-# Ensure repo root is on path
-sys.path.insert(0, os.fspath(Path(__file__).resolve().parent.parent))
-
 import sourcecombine
 from utils import DEFAULT_CONFIG
 
@@ -8,9 +8,6 @@ import pytest
 import logging
 import io
 
-# Ensure repo root is on path
-sys.path.insert(0, os.fspath(Path(__file__).resolve().parent.parent))
-
 import sourcecombine
 import utils
 
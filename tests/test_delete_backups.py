@@ -1,9 +1,4 @@
-import sys; import os; from pathlib import Path; sys.path.insert(0, os.fspath(Path(__file__).resolve().parent.parent))
-
-import os
-import sys
 import logging
-from pathlib import Path
 import pytest
 from unittest.mock import patch
 
@@ -1,10 +1,3 @@
-import sys
-import os
-from pathlib import Path
-
-# Ensure repo root is on path
-sys.path.insert(0, os.fspath(Path(__file__).resolve().parent.parent))
-
 import json
 from sourcecombine import extract_files
 
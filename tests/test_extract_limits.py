@@ -1,13 +1,6 @@
-
-import sys
-import os
 import json
-from pathlib import Path
 import pytest
 
-# Add project root to path
-sys.path.insert(0, os.fspath(Path(__file__).resolve().parent.parent))
-
 from sourcecombine import extract_files
 
 @pytest.fixture
@@ -1,5 +1,3 @@
-import sys; import os; from pathlib import Path; sys.path.insert(0, os.fspath(Path(__file__).resolve().parent.parent))
-
 import json
 import logging
 import sys
@@ -8,8 +6,6 @@ from pathlib import Path
 from unittest.mock import patch, MagicMock
 import pytest
 
-# Ensure repo root is on path
-
 from sourcecombine import extract_files, main, _render_single_pass, _render_global_template
 from utils import DEFAULT_CONFIG
 
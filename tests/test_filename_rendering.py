@@ -1,7 +1,3 @@
-import sys; import os; from pathlib import Path; sys.path.insert(0, os.fspath(Path(__file__).resolve().parent.parent))
-
-import os
-import sys
 from pathlib import Path, PureWindowsPath
 import pytest
 
@@ -1,14 +1,10 @@
-import sys; import os; from pathlib import Path; sys.path.insert(0, os.fspath(Path(__file__).resolve().parent.parent))
-
 import sys
 import os
 import logging
 import pytest
 from unittest.mock import patch
-from pathlib import Path
 import io
 
-# Adjust sys.path to include the project root
 
 from sourcecombine import main
 
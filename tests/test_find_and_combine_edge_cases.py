@@ -1,9 +1,5 @@
-import sys; import os; from pathlib import Path; sys.path.insert(0, os.fspath(Path(__file__).resolve().parent.parent))
-
 import logging
 import os
-import sys
-from pathlib import Path
 
 
 
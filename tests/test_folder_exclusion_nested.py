@@ -1,6 +1,4 @@
-import sys; import os; from pathlib import Path; sys.path.insert(0, os.fspath(Path(__file__).resolve().parent.parent))
-
-from pathlib import Path, PurePath
+from pathlib import PurePath
 from sourcecombine import should_include
 
 def test_should_include_nested_folder_exclusion():
@@ -1,13 +1,7 @@
-import sys
-import os
-from pathlib import Path
 from unittest.mock import MagicMock, patch
 import sourcecombine
 import pytest
 
-# Adjust sys.path to include the project root
-sys.path.insert(0, os.fspath(Path(__file__).resolve().parent.parent))
-
 def test_folder_redundancy_filtering(monkeypatch, capsys):
     """Verify that redundant parent folders are filtered from the summary."""
     # Mock stats where a deep folder has the same stats as its parents
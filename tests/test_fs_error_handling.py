@@ -1,14 +1,7 @@
-import sys; import os; from pathlib import Path; sys.path.insert(0, os.fspath(Path(__file__).resolve().parent.parent))
-
 import logging
-import os
-import sys
 from unittest.mock import MagicMock
 from pathlib import Path, PurePath
 
-
-# Ensure sourcecombine is importable
-
 from sourcecombine import collect_file_paths, should_include
 
 def test_collect_file_paths_root_does_not_exist(caplog):
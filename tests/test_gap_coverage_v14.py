@@ -1,9 +1,7 @@
-import sys; import os; from pathlib import Path; sys.path.insert(0, os.fspath(Path(__file__).resolve().parent.parent))
-
 import json
 import logging
 import pytest
-from pathlib import PurePath, Path
+from pathlib import PurePath
 from sourcecombine import _parse_combined_content, _pair_files, should_include, extract_files, _process_paired_files, FileProcessor
 from utils import validate_config
 
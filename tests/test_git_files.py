@@ -1,14 +1,10 @@
-import sys; import os; from pathlib import Path; sys.path.insert(0, os.fspath(Path(__file__).resolve().parent.parent))
 import utils
 
 import subprocess
 import pytest
 from unittest.mock import MagicMock, patch
 from pathlib import Path
-import os
-import sys
 
-# Adjust sys.path to include the project root
 
 import sourcecombine
 
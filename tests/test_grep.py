@@ -1,4 +1,3 @@
-import sys; import os; from pathlib import Path; sys.path.insert(0, os.fspath(Path(__file__).resolve().parent.parent))
 import utils
 
 import json
@@ -84,7 +83,7 @@ def test_should_include_grep_error_coverage(caplog):
     filter_opts = {'grep': 'pattern'}
     search_opts = {}
 
-    with patch("re.search", side_effect=Exception("Regex error")):
+    with patch("sourcecombine._compile_grep_pattern", side_effect=Exception("Regex error")):
         with caplog.at_level(logging.WARNING):
             # Passing None for file_path is safe as long as we don't trigger other checks
             include, reason = should_include(None, Path("test.txt"), filter_opts, search_opts, return_reason=True)
@@ -1,12 +1,7 @@
-import sys; import os; from pathlib import Path; sys.path.insert(0, os.fspath(Path(__file__).resolve().parent.parent))
 import utils
 
 import json
-from pathlib import Path
 import pytest
-import sys
-
-# Ensure repo root is on path
 
 from sourcecombine import find_and_combine_files
 
@@ -1,8 +1,4 @@
-import sys; import os; from pathlib import Path; sys.path.insert(0, os.fspath(Path(__file__).resolve().parent.parent))
-
 import json
-import os
-from pathlib import Path
 import subprocess
 import sys
 
@@ -1,12 +1,8 @@
-import sys; import os; from pathlib import Path; sys.path.insert(0, os.fspath(Path(__file__).resolve().parent.parent))
 import utils
 
-import sys
 from pathlib import Path
 import pytest
 
-# Ensure repo root is on path
-
 from sourcecombine import should_include
 
 
@@ -1,10 +1,5 @@
-import sys; import os; from pathlib import Path; sys.path.insert(0, os.fspath(Path(__file__).resolve().parent.parent))
-
-import sys
 from pathlib import Path
 
-# Ensure repo root is on path
-
 from sourcecombine import _render_template
 from utils import get_language_tag
 
@@ -1,4 +1,4 @@
-import sys; import os; from pathlib import Path; sys.path.insert(0, os.fspath(Path(__file__).resolve().parent.parent))
+import os
 from unittest.mock import MagicMock, patch
 import sourcecombine
 
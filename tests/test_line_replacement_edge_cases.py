@@ -1,14 +1,8 @@
-import sys; import os; from pathlib import Path; sys.path.insert(0, os.fspath(Path(__file__).resolve().parent.parent))
 import utils
 
-import sys
-import os
 import textwrap
-from pathlib import Path
 import pytest
 
-# Ensure project root is in path
-
 from utils import _replace_line_block, apply_line_regex_replacements, validate_regex_pattern
 
 def test_replace_line_block_removes_block_when_replacement_is_none():
@@ -106,3 +100,39 @@ def test_replace_line_block_avoids_stray_newline_when_all_removed():
     regex = validate_regex_pattern(r"^#")
     result = _replace_line_block(text, regex, replacement=None)
     assert result == ""
+
+def test_apply_line_regex_replacements_accepts_compiled_patterns():
+    """Verify that rules may provide an already compiled pattern."""
+    text = "keep\n# remove 1\n# remove 2\ndone"
+    rules = [{"pattern": validate_regex_pattern(r"^#"), "replacement": "<removed>"}]
+    result = apply_line_regex_replacements(text, rules)
+    assert result == "keep\n<removed>\ndone"
+
+def test_validate_regex_pattern_reuses_compiled_pattern():
+    """Verify that the same pattern text is only compiled once."""
+    utils._compile_regex.cache_clear()
+    first = validate_regex_pattern(r"^# cached")
+    assert validate_regex_pattern(r"^# cached") is first
+    info = utils._compile_regex.cache_info()
+    assert (info.misses, info.hits) == (1, 1)
+
+def test_apply_line_regex_replacements_later_rules_see_multiline_replacement():
+    """Verify that lines inserted by one rule are matched line by line by the next."""
+    text = "a\n# one\nb\n"
+    rules = [
+        {"pattern": r"^#", "replacement": "x\ny"},
+        {"pattern": r"^y$", "replacement": "z"},
+    ]
+    assert apply_line_regex_replacements(text, rules) == "a\nx\nz\nb\n"
+
+def test_apply_line_regex_replacements_trailing_empty_replacement():
+    """Verify that an empty replacement at the end matches rule-by-rule application."""
+    text = "keep\n# drop"
+    rules = [
+        {"pattern": r"^#", "replacement": ""},
+        {"pattern": r"^$", "replacement": "blank"},
+    ]
+    expected = text
+    for rule in rules:
+        expected = _replace_line_block(expected, validate_regex_pattern(rule["pattern"]), rule["replacement"])
+    assert apply_line_regex_replacements(text, rules) == expected == "keep\n"
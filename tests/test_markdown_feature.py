@@ -1,11 +1,5 @@
-import sys; import os; from pathlib import Path; sys.path.insert(0, os.fspath(Path(__file__).resolve().parent.parent))
-
-import os
-import sys
 import io
-from pathlib import Path
 
-# Add project root to sys.path
 
 from sourcecombine import FileProcessor, find_and_combine_files
 
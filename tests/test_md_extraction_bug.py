@@ -1,13 +1,8 @@
-import sys; import os; from pathlib import Path; sys.path.insert(0, os.fspath(Path(__file__).resolve().parent.parent))
 import utils
 
-import os
 import sys
 import copy
 
-# Ensure we can import sourcecombine and utils
-sys.path.append(os.getcwd())
-
 import sourcecombine
 
 
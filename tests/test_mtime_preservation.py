@@ -1,8 +1,5 @@
-import sys; import os; from pathlib import Path; sys.path.insert(0, os.fspath(Path(__file__).resolve().parent.parent))
-
 import os
 import time
-from pathlib import Path
 import json
 import pytest
 from sourcecombine import find_and_combine_files, extract_files
@@ -1,8 +1,5 @@
-import sys; import os; from pathlib import Path; sys.path.insert(0, os.fspath(Path(__file__).resolve().parent.parent))
-
 import json
 import pytest
-from pathlib import Path
 import sourcecombine
 import utils
 
@@ -1,4 +1,3 @@
-import sys; import os; from pathlib import Path; sys.path.insert(0, os.fspath(Path(__file__).resolve().parent.parent))
 from sourcecombine import _render_paired_filename
 from pathlib import Path
 import pytest
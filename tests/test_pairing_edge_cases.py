@@ -1,9 +1,6 @@
-import sys; import os; from pathlib import Path; sys.path.insert(0, os.fspath(Path(__file__).resolve().parent.parent))
 import utils
 
 import os
-import sys
-from pathlib import Path
 
 import pytest
 
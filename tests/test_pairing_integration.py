@@ -1,11 +1,3 @@
-import sys; import os; from pathlib import Path; sys.path.insert(0, os.fspath(Path(__file__).resolve().parent.parent))
-
-import os
-import sys
-from pathlib import Path
-
-
-
 from sourcecombine import find_and_combine_files
 
 def test_find_and_combine_files_pairing_integration(tmp_path):
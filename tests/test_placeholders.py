@@ -1,5 +1,3 @@
-import sys; import os; from pathlib import Path; sys.path.insert(0, os.fspath(Path(__file__).resolve().parent.parent))
-
 from sourcecombine import find_and_combine_files
 
 def test_file_information_placeholders(tmp_path):
@@ -191,9 +189,7 @@ def test_placeholder_prefix_matching(tmp_path):
     # If DIR was matched first, SLUG would be corrupted (for example, sub_SLUG}})
     assert "DIR:sub SLUG:sub" in result
     assert "_SLUG}}" not in result
-import os
 import pytest
-from pathlib import Path
 from sourcecombine import find_and_combine_files
 from utils import DEFAULT_CONFIG
 
@@ -1,12 +1,7 @@
-import os
 import sys
-from pathlib import Path
 import pytest
 from unittest.mock import patch
 
-# Add root directory to sys.path for imports
-sys.path.insert(0, os.fspath(Path(__file__).resolve().parent.parent))
-
 import sourcecombine
 import utils
 
@@ -1,5 +1,3 @@
-import sys; import os; from pathlib import Path; sys.path.insert(0, os.fspath(Path(__file__).resolve().parent.parent))
-
 from unittest.mock import patch, MagicMock
 import pytest
 from utils import read_file_best_effort
@@ -11,9 +9,8 @@ def test_read_file_best_effort_retries_on_null_bytes_in_utf8(tmp_path):
     content_bytes = b"hello\x00world"
     f.write_bytes(content_bytes)
 
-    # We patch read_bytes to ensure we actually hit the fallback path.
-    # If the initial open() worked and returned, read_bytes wouldn't be called.
-    with patch("pathlib.Path.read_bytes", return_value=content_bytes) as mock_read:
+    # We patch the byte reader to ensure we actually hit the fallback path.
+    with patch("utils._read_file_bytes", return_value=content_bytes) as mock_read:
         content, _ = read_file_best_effort(f)
         assert content == "hello\x00world"
         mock_read.assert_called_once()
@@ -27,7 +24,7 @@ def test_read_file_handles_read_bytes_exception(tmp_path):
     f = tmp_path / "unreadable.txt"
     f.write_bytes(b"\x00") # Force UnicodeError
 
-    with patch("pathlib.Path.read_bytes", side_effect=PermissionError("Boom")), \
+    with patch("utils._read_file_bytes", side_effect=PermissionError("Boom")), \
          patch("logging.warning") as mock_log:
         content, _ = read_file_best_effort(f)
         assert content == ""
@@ -100,3 +97,75 @@ def test_read_file_fallback_no_guess(tmp_path):
         assert content == "\ufffd"
         found = any("Could not detect encoding" in str(arg) for call in mock_log.call_args_list for arg in call.args)
         assert found
+
+def test_read_file_detects_encoding_from_leading_sample(tmp_path):
+    """Only the first bytes are analyzed when the guess decodes the whole file."""
+    import utils
+
+    f = tmp_path / "large_latin.txt"
+    text = "café " * 2000
+    f.write_bytes(text.encode("cp1252"))
+
+    with patch("utils.from_bytes", wraps=utils.from_bytes) as mock_from_bytes:
+        content, _ = read_file_best_effort(f)
+        assert content == text
+        assert mock_from_bytes.call_count == 1
+        sample = mock_from_bytes.call_args.args[0]
+        assert len(sample) == utils._ENCODING_SAMPLE_SIZE
+
+def test_read_file_rechecks_full_data_when_sample_guess_fails(tmp_path):
+    """A guess based on an ASCII-only prefix falls back to full detection."""
+    import utils
+
+    f = tmp_path / "late_latin.txt"
+    data = ("a" * (utils._ENCODING_SAMPLE_SIZE * 2) + "caf\u00e9").encode("cp1252")
+    f.write_bytes(data)
+
+    with patch("utils.from_bytes", wraps=utils.from_bytes) as mock_from_bytes:
+        content, _ = read_file_best_effort(f)
+        assert mock_from_bytes.call_count == 2
+        assert mock_from_bytes.call_args.args[0] == data
+        assert "\ufffd" not in content
+
+def test_read_file_reuses_detected_encoding_for_unchanged_file(tmp_path):
+    """Detection runs once per unchanged file and again after it is modified."""
+    import utils
+
+    f = tmp_path / "latin.txt"
+    f.write_bytes("café".encode("cp1252"))
+
+    with patch("utils.from_bytes", wraps=utils.from_bytes) as mock_from_bytes:
+        first = read_file_best_effort(f)
+        second = read_file_best_effort(f)
+        assert first == second
+        assert mock_from_bytes.call_count == 1
+
+        f.write_bytes("crème brûlée".encode("cp1252"))
+        read_file_best_effort(f)
+        assert mock_from_bytes.call_count == 2
+
+def test_read_file_bytes_reads_past_stale_size(tmp_path, monkeypatch):
+    """Data beyond the size reported by fstat (a growing or special file) is still read."""
+    import os
+    import utils
+
+    f = tmp_path / "grown.txt"
+    f.write_bytes(b"0123456789" * 10000)
+
+    monkeypatch.setattr(utils.os, "fstat", lambda fd: os.stat_result((0,) * 6 + (3,) + (0,) * 3))
+    assert utils._read_file_bytes(f) == b"0123456789" * 10000
+
+def test_read_file_bom_skips_detection(tmp_path):
+    """UTF-16 and UTF-32 files with a byte order mark bypass charset detection."""
+    cases = [
+        ("utf-16-le", b"\xff\xfe", "utf_16"),
+        ("utf-16-be", b"\xfe\xff", "utf_16"),
+        ("utf-32-le", b"\xff\xfe\x00\x00", "utf_32"),
+        ("utf-32-be", b"\x00\x00\xfe\xff", "utf_32"),
+    ]
+    with patch("utils.from_bytes") as mock_from_bytes:
+        for codec, bom, expected in cases:
+            f = tmp_path / f"{codec}.txt"
+            f.write_bytes(bom + "héllo\n".encode(codec))
+            assert read_file_best_effort(f) == ("héllo\n", expected)
+        mock_from_bytes.assert_not_called()
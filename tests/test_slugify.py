@@ -1,10 +1,3 @@
-import sys; import os; from pathlib import Path; sys.path.insert(0, os.fspath(Path(__file__).resolve().parent.parent))
-
-import os
-import sys
-from pathlib import Path
-
-
 from sourcecombine import _slugify_relative_dir
 
 def test_slugify_basic_folders():
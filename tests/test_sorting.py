@@ -1,14 +1,9 @@
-import sys; import os; from pathlib import Path; sys.path.insert(0, os.fspath(Path(__file__).resolve().parent.parent))
 import utils
 
-import sys
 import os
 import time
-from pathlib import Path
 import pytest
 
-# Add project root to path
-
 import logging
 from io import StringIO
 from contextlib import contextmanager
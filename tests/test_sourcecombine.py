@@ -1,4 +1,3 @@
-import sys; import os; from pathlib import Path; sys.path.insert(0, os.fspath(Path(__file__).resolve().parent.parent))
 import utils
 
 import io
@@ -834,7 +833,7 @@ def test_collect_file_paths_oserror_it(tmp_path):
     root = tmp_path / "restricted"
     root.mkdir()
 
-    with patch('pathlib.Path.iterdir', side_effect=OSError("Access denied")):
+    with patch('sourcecombine.os.scandir', side_effect=OSError("Access denied")):
         paths, root_out, excluded = collect_file_paths(
             str(root), recursive=False, exclude_folders=[]
         )
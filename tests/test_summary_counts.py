@@ -1,11 +1,5 @@
-import sys; import os; from pathlib import Path; sys.path.insert(0, os.fspath(Path(__file__).resolve().parent.parent))
 import utils
 
-import sys
-import os
-from pathlib import Path
-
-# Adjust sys.path to include the project root
 
 
 from sourcecombine import find_and_combine_files
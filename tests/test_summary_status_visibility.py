@@ -1,11 +1,5 @@
-import sys
-import os
-from pathlib import Path
 from unittest.mock import MagicMock
 
-# Adjust sys.path to include the project root
-sys.path.insert(0, os.fspath(Path(__file__).resolve().parent.parent))
-
 import sourcecombine
 
 from unittest.mock import patch, MagicMock
@@ -1,11 +1,6 @@
-import sys
 import os
-from pathlib import Path
 from unittest.mock import MagicMock, patch
 
-# Adjust sys.path to include the project root
-sys.path.insert(0, os.fspath(Path(__file__).resolve().parent.parent))
-
 import sourcecombine
 
 def test_summary_redesign_largest_files(monkeypatch, capsys):
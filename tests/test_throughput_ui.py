@@ -1,9 +1,4 @@
-import sys; import os; from pathlib import Path; sys.path.insert(0, os.fspath(Path(__file__).resolve().parent.parent))
-
 from unittest.mock import MagicMock
-import sys
-import os
-from pathlib import Path
 import sourcecombine
 
 def test_throughput_with_tokens(monkeypatch, capsys):
@@ -1,10 +1,3 @@
-import sys; import os; from pathlib import Path; sys.path.insert(0, os.fspath(Path(__file__).resolve().parent.parent))
-
-import os
-import sys
-
-# Adjust sys.path to include the project root
-
 from sourcecombine import _truncate_path
 
 def test_truncate_path_less_than_four_width():
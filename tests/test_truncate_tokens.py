@@ -1,12 +1,6 @@
-import sys
-import os
-from pathlib import Path
 from unittest.mock import patch, MagicMock
 import pytest
 
-# Ensure repo root is on path
-sys.path.insert(0, os.fspath(Path(__file__).resolve().parent.parent))
-
 from utils import truncate_tokens, process_content
 
 def test_truncate_tokens_no_tiktoken():
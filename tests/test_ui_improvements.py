@@ -1,13 +1,9 @@
-import sys; import os; from pathlib import Path; sys.path.insert(0, os.fspath(Path(__file__).resolve().parent.parent))
-
 import sys
 import os
-from pathlib import Path
 from unittest.mock import patch
 import pytest
 import yaml
 
-# Adjust sys.path to include the project root
 
 from sourcecombine import main
 
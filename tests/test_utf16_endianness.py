@@ -1,11 +1,3 @@
-import sys; import os; from pathlib import Path; sys.path.insert(0, os.fspath(Path(__file__).resolve().parent.parent))
-
-import sys
-from pathlib import Path
-
-# Add current directory to sys.path to 
-sys.path.append(str(Path(__file__).parent.parent))
-
 from utils import read_file_best_effort
 
 def test_read_file_utf16be_no_bom(tmp_path):
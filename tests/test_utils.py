@@ -1,14 +1,10 @@
-import sys; import os; from pathlib import Path; sys.path.insert(0, os.fspath(Path(__file__).resolve().parent.parent))
 import utils
 
 import logging
 import os
 import sys
-import textwrap
-from pathlib import Path
 
 import pytest
-import yaml
 
 
 from utils import (
@@ -17,8 +13,11 @@ from utils import (
     compact_whitespace,
     apply_line_regex_replacements,
     load_and_validate_config,
+    compile_options,
     process_content,
+    measure_files,
     read_file_best_effort,
+    read_files_best_effort,
     format_size,
     validate_config,
     _validate_pairing_section,
@@ -36,16 +35,7 @@ def test_compact_whitespace_normalizes_crlf_and_trims():
 
 
 def test_apply_line_regex_replacements_collapses_blocks():
-    text = textwrap.dedent(
-        """
-        keep
-        # remove me
-        # remove me too
-        still here
-        # remove again
-        done
-        """
-    ).strip()
+    text = "keep\n# remove me\n# remove me too\nstill here\n# remove again\ndone"
     rules = [
         {"pattern": r"^#", "replacement": "<removed>"},
     ]
@@ -70,18 +60,117 @@ def test_process_content_applies_all_options(tmp_path):
     assert result == "first\n\nline 2\n"
 
 
+def test_compile_options_matches_raw_options(monkeypatch):
+    options = {
+        "regex_replacements": [
+            {"pattern": r"(\d+)", "replacement": r"<\1>"},
+            {"pattern": "[", "replacement": None},
+        ],
+        "line_regex_replacements": [{"pattern": r"^#"}],
+        "compact_whitespace": True,
+    }
+    compiled = compile_options(options)
+    assert compiled["regex_replacements"][0]["pattern"].pattern == r"(\d+)"
+    assert compiled["regex_replacements"][1]["pattern"] == "["
+    assert options["regex_replacements"][0]["pattern"] == r"(\d+)"
+    assert compile_options({}) == {}
+    with pytest.raises(utils.InvalidConfigError):
+        compile_options({"line_regex_replacements": [{"pattern": "("}]})
+
+    text = "# note\nvalue   42\n"
+    expected = process_content(text, options)
+    monkeypatch.setattr(utils, "validate_regex_pattern", None)
+    assert process_content(text, compiled) == expected == "value  <42>\n"
+
+
+def test_process_content_keeps_unterminated_c_comment():
+    options = {"remove_all_c_style_comments": True}
+    text = "a /* one */ b /*/ c */ d /* open" + " /* x" * 1000
+    assert process_content(text, options) == "a  b  d /* open" + " /* x" * 1000
+    assert process_content("no comments /* here", options) == "no comments /* here"
+
+
+def test_measure_files_counts_processed_files_in_order(tmp_path, monkeypatch):
+    monkeypatch.setattr(utils, "tiktoken", None)
+    options = {
+        "remove_all_c_style_comments": True,
+        "regex_replacements": [{"pattern": r"value", "replacement": "v"}],
+    }
+    paths = []
+    for i in range(utils._PARALLEL_PROCESS_MIN_FILES + 6):
+        path = tmp_path / f"f{i:03}.c"
+        path.write_text(f"/* {i} */value\n" * (i + 1), encoding="utf-8")
+        paths.append(path)
+    lines = [i + 1 for i in range(len(paths))]
+    tokens = [utils.estimate_tokens("v\n" * (i + 1))[0] for i in range(len(paths))]
+
+    assert list(measure_files(paths, "lines", options, workers=2)) == lines
+    assert list(measure_files(paths, "tokens", options, workers=2)) == tokens
+    assert list(measure_files(paths, "lines", options, workers=1)) == lines
+    assert list(measure_files([], "lines", options)) == []
+
+    # Stopping early shuts the pool down without waiting for queued work
+    counts = measure_files(paths, "lines", options, workers=2)
+    assert next(counts) == 1
+    counts.close()
+
+
+@pytest.mark.parametrize("error", [NotImplementedError, OSError, ValueError])
+def test_measure_files_falls_back_without_multiprocessing(tmp_path, monkeypatch, error):
+    def unavailable(*args, **kwargs):
+        raise error("no process pool")
+
+    monkeypatch.setattr(utils, "ProcessPoolExecutor", unavailable)
+    paths = []
+    for i in range(utils._PARALLEL_PROCESS_MIN_FILES):
+        path = tmp_path / f"f{i:03}.txt"
+        path.write_text("a\nb\n", encoding="utf-8")
+        paths.append(path)
+    assert list(measure_files(paths, "lines", {}, workers=4)) == [2] * len(paths)
+
+
+def test_measure_files_caps_worker_count(tmp_path, monkeypatch):
+    requested = []
+
+    def record(max_workers):
+        requested.append(max_workers)
+        raise NotImplementedError
+
+    monkeypatch.setattr(utils, "ProcessPoolExecutor", record)
+    monkeypatch.setattr(utils, "_available_cpu_count", lambda: 128)
+    paths = []
+    for i in range(200):
+        path = tmp_path / f"f{i:03}.txt"
+        path.write_text("a\n", encoding="utf-8")
+        paths.append(path)
+
+    list(measure_files(paths, "lines", {}))
+    monkeypatch.setattr(utils.sys, "platform", "win32")
+    list(measure_files(paths, "lines", {}, workers=100))
+    assert requested == [utils._DEFAULT_PROCESS_WORKERS, 61]
+
+
+def _write_fixture_bytes(path, data):
+    """Write ``data`` to ``path`` with a single open/write/close."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
 def test_read_file_best_effort_handles_various_encodings(tmp_path):
     utf8_bom = "hello"
     bom_file = tmp_path / "utf8_bom.txt"
-    bom_file.write_bytes("\ufeff".encode("utf-8") + utf8_bom.encode("utf-8"))
+    _write_fixture_bytes(bom_file, "\ufeff".encode("utf-8") + utf8_bom.encode("utf-8"))
 
     latin_text = "café"
     latin_file = tmp_path / "latin.txt"
-    latin_file.write_bytes(latin_text.encode("cp1252"))
+    _write_fixture_bytes(latin_file, latin_text.encode("cp1252"))
 
     cjk_text = "漢字仮名"
     cjk_file = tmp_path / "cjk_utf16.txt"
-    cjk_file.write_bytes(cjk_text.encode("utf-16"))
+    _write_fixture_bytes(cjk_file, cjk_text.encode("utf-16"))
 
     content, _ = read_file_best_effort(bom_file)
     assert content == utf8_bom
@@ -91,6 +180,21 @@ def test_read_file_best_effort_handles_various_encodings(tmp_path):
     assert content == cjk_text
 
 
+def test_read_files_best_effort_preserves_order(tmp_path):
+    paths = []
+    for i in range(12):
+        path = tmp_path / f"f{i}.txt"
+        path.write_text(f"file {i}", encoding="utf-8")
+        paths.append(path)
+    missing = tmp_path / "missing.txt"
+
+    results = read_files_best_effort(paths)
+    assert [content for content, _ in results] == [f"file {i}" for i in range(12)]
+    assert read_files_best_effort([]) == []
+    with pytest.raises(FileNotFoundError):
+        read_files_best_effort(paths + [missing])
+
+
 def test_read_file_best_effort_handles_utf16_edge_cases(tmp_path):
     bom_only = tmp_path / "utf16_bom_only.txt"
     bom_only.write_bytes(b"\xff\xfe")
@@ -106,15 +210,8 @@ def test_read_file_best_effort_handles_utf16_edge_cases(tmp_path):
     assert content == content_str
 
 
-def _write_config(tmp_path: Path, data: dict) -> Path:
-    path = tmp_path / "config.yml"
-    path.write_text(yaml.safe_dump(data), encoding="utf-8")
-    return path
-
-
-def test_load_and_validate_config_merges_defaults(tmp_path):
-    config_path = _write_config(
-        tmp_path,
+def test_load_and_validate_config_merges_defaults(write_config):
+    config_path = write_config(
         {
             "search": {"root_folders": ["."]},
         },
@@ -123,11 +220,28 @@ def test_load_and_validate_config_merges_defaults(tmp_path):
     assert config["output"]["file"] == DEFAULT_CONFIG["output"]["file"]
 
 
+def test_validate_config_does_not_share_default_lists():
+    config = {"search": {"root_folders": ["."]}}
+    validate_config(config)
+    folders = config["filters"]["exclusions"]["folders"]
+    assert folders == DEFAULT_CONFIG["filters"]["exclusions"]["folders"]
+    assert folders is not DEFAULT_CONFIG["filters"]["exclusions"]["folders"]
+
+
+def test_validate_config_applies_nested_defaults_in_order():
+    config = {"search": {"root_folders": ["."]}, "filters": {"exclusions": None}}
+    validate_config(config)
+    assert list(config) == ["search", "filters"] + [
+        key for key in DEFAULT_CONFIG if key not in ("search", "filters")
+    ]
+    assert list(config["filters"]["exclusions"]) == list(DEFAULT_CONFIG["filters"]["exclusions"])
+    assert config["filters"]["exclusions"] is not DEFAULT_CONFIG["filters"]["exclusions"]
+
+
 def test_load_and_validate_config_rejects_allowed_extensions_with_inclusion_groups(
-    tmp_path
+    write_config
 ):
-    config_path = _write_config(
-        tmp_path,
+    config_path = write_config(
         {
             "search": {
                 "root_folders": ["."],
@@ -146,8 +260,7 @@ def test_load_and_validate_config_rejects_allowed_extensions_with_inclusion_grou
 
     assert "cannot be used at the same time" in str(excinfo.value)
 
-    pairing_path = _write_config(
-        tmp_path,
+    pairing_path = write_config(
         {
             "search": {
                 "root_folders": ["."],
@@ -164,9 +277,8 @@ def test_load_and_validate_config_rejects_allowed_extensions_with_inclusion_grou
         load_and_validate_config(pairing_path)
 
 
-def test_inclusion_group_backslashes_are_normalized(tmp_path, caplog):
-    config_path = _write_config(
-        tmp_path,
+def test_inclusion_group_backslashes_are_normalized(write_config, caplog):
+    config_path = write_config(
         {
             "search": {"root_folders": ["."]},
             "filters": {
@@ -188,9 +300,8 @@ def test_inclusion_group_backslashes_are_normalized(tmp_path, caplog):
     assert "uses backslashes" in caplog.text
 
 
-def test_load_and_validate_config_sets_allowed_extensions_when_pairing_enabled(tmp_path):
-    config_path = _write_config(
-        tmp_path,
+def test_load_and_validate_config_sets_allowed_extensions_when_pairing_enabled(write_config):
+    config_path = write_config(
         {
             "search": {"root_folders": ["."]},
             "pairing": {
@@ -205,9 +316,8 @@ def test_load_and_validate_config_sets_allowed_extensions_when_pairing_enabled(t
     assert "allowed_extensions" not in config["search"]
 
 
-def test_load_and_validate_config_preserves_user_allowed_extensions(tmp_path):
-    config_path = _write_config(
-        tmp_path,
+def test_load_and_validate_config_preserves_user_allowed_extensions(write_config):
+    config_path = write_config(
         {
             "search": {
                 "root_folders": ["."],
@@ -220,9 +330,8 @@ def test_load_and_validate_config_preserves_user_allowed_extensions(tmp_path):
     assert config["search"]["effective_allowed_extensions"] == (".py",)
 
 
-def test_load_and_validate_config_rejects_non_boolean_skip_binary(tmp_path):
-    config_path = _write_config(
-        tmp_path,
+def test_load_and_validate_config_rejects_non_boolean_skip_binary(write_config):
+    config_path = write_config(
         {
             "search": {"root_folders": ["."]},
             "filters": {"skip_binary": "yes"},
@@ -233,9 +342,8 @@ def test_load_and_validate_config_rejects_non_boolean_skip_binary(tmp_path):
         load_and_validate_config(config_path)
 
 
-def test_load_and_validate_config_reports_regex_context(tmp_path):
-    config_path = _write_config(
-        tmp_path,
+def test_load_and_validate_config_reports_regex_context(write_config):
+    config_path = write_config(
         {
             "search": {"root_folders": ["."]},
             "processing": {
@@ -254,9 +362,8 @@ def test_load_and_validate_config_reports_regex_context(tmp_path):
     assert str(config_path) in message
 
 
-def test_load_and_validate_config_reports_line_regex_context(tmp_path):
-    config_path = _write_config(
-        tmp_path,
+def test_load_and_validate_config_reports_line_regex_context(write_config):
+    config_path = write_config(
         {
             "search": {"root_folders": ["."]},
             "processing": {
@@ -290,9 +397,8 @@ def test_load_and_validate_config_reports_unterminated_quote(tmp_path):
     assert "closing quotes" in message
 
 
-def test_load_and_validate_config_rejects_in_place_groups(tmp_path):
-    config_path = _write_config(
-        tmp_path,
+def test_load_and_validate_config_rejects_in_place_groups(write_config):
+    config_path = write_config(
         {
             "search": {"root_folders": ["."]},
             "processing": {
@@ -314,9 +420,8 @@ def test_load_and_validate_config_rejects_in_place_groups(tmp_path):
         ("max_size_bytes", -1),
     ],
 )
-def test_load_and_validate_config_rejects_invalid_size_filters(tmp_path, field, value):
-    config_path = _write_config(
-        tmp_path,
+def test_load_and_validate_config_rejects_invalid_size_filters(write_config, field, value):
+    config_path = write_config(
         {
             "search": {"root_folders": ["."]},
             "filters": {field: value},
@@ -343,9 +448,8 @@ def test_load_and_validate_config_rejects_invalid_size_filters(tmp_path, field,
         "max_size_placeholder",
     ],
 )
-def test_load_and_validate_config_rejects_non_string_output_fields(tmp_path, field):
-    config_path = _write_config(
-        tmp_path,
+def test_load_and_validate_config_rejects_non_string_output_fields(write_config, field):
+    config_path = write_config(
         {
             "search": {"root_folders": ["."]},
             "output": {field: 123},
@@ -358,9 +462,8 @@ def test_load_and_validate_config_rejects_non_string_output_fields(tmp_path, fie
     assert f"output.{field}" in str(excinfo.value)
 
 
-def test_load_and_validate_config_warns_on_placeholder_missing_filename(tmp_path, caplog):
-    config_path = _write_config(
-        tmp_path,
+def test_load_and_validate_config_warns_on_placeholder_missing_filename(write_config, caplog):
+    config_path = write_config(
         {
             "search": {"root_folders": ["."]},
             "output": {"max_size_placeholder": "File is too large"},
@@ -380,6 +483,13 @@ def test_add_line_numbers():
     assert add_line_numbers("a\nb\n") == "1: a\n2: b\n"
 
 
+def test_add_line_numbers_past_prefix_table():
+    count = utils._LINE_NUMBER_PREFIX_COUNT + 2
+    numbered = add_line_numbers("x\n" * count).splitlines()
+    assert len(numbered) == count
+    assert numbered[-1] == f"{count}: x"
+
+
 def test_compact_whitespace_converts_spaces_to_tabs():
     assert compact_whitespace("line\n    indent") == "line\n\tindent"
     assert compact_whitespace(" " * 8 + "content") == "\t\tcontent"
@@ -391,6 +501,14 @@ def test_compact_whitespace_removes_spaces_around_tabs():
     assert compact_whitespace("indent  \t\n") == "indent\n"
 
 
+def test_compact_whitespace_trims_spaces_around_tabs_only():
+    groups = {key: False for key in utils.COMPACT_WHITESPACE_GROUPS}
+    groups["trim_spaces_around_tabs"] = True
+    assert compact_whitespace("a  \t  b", groups=groups) == "a\tb"
+    assert compact_whitespace("x \t \t  y", groups=groups) == "x\t\t  y"
+    assert compact_whitespace("  \t  b", groups=groups) == "\tb"
+
+
 def test_compact_whitespace_replaces_standalone_tabs():
     assert compact_whitespace("a\tb") == "a b"
 
@@ -399,6 +517,10 @@ def test_compact_whitespace_collapses_long_space_runs():
     assert compact_whitespace("a   b") == "a  b"
 
 
+def test_compact_whitespace_collapses_long_blank_line_runs():
+    assert compact_whitespace("a" + "\n" * 50 + "b\n\n\n\nc") == "a\n\nb\n\nc"
+
+
 def test_compact_whitespace_handles_mixed_indent_tabs_and_spaces():
     assert compact_whitespace("  \t  code") == "\tcode"
     assert compact_whitespace("\t    code") == "\t\tcode"
@@ -443,10 +565,9 @@ def test_process_content_compact_whitespace_overrides_can_disable_group():
     assert process_content(text, options) == text
 
 
-def test_validate_glob_pattern_warns_on_absolute_paths(caplog, tmp_path):
+def test_validate_glob_pattern_warns_on_absolute_paths(caplog, write_config):
     load_and_validate_config(
-        _write_config(
-            tmp_path,
+        write_config(
             {
                 "search": {"root_folders": ["."]},
                 "filters": {
@@ -460,10 +581,9 @@ def test_validate_glob_pattern_warns_on_absolute_paths(caplog, tmp_path):
     assert "appears to be an absolute path" in caplog.text
 
 
-def test_validate_glob_pattern_warns_on_regex_syntax(caplog, tmp_path):
+def test_validate_glob_pattern_warns_on_regex_syntax(caplog, write_config):
     load_and_validate_config(
-        _write_config(
-            tmp_path,
+        write_config(
             {
                 "search": {"root_folders": ["."]},
                 "filters": {
@@ -480,11 +600,10 @@ def test_validate_glob_pattern_warns_on_regex_syntax(caplog, tmp_path):
     assert "advanced search syntax" in caplog.text
 
 
-def test_validate_glob_pattern_raises_on_non_string_pattern(tmp_path):
+def test_validate_glob_pattern_raises_on_non_string_pattern(write_config):
     with pytest.raises(utils.InvalidConfigError, match="must be text"):
         load_and_validate_config(
-            _write_config(
-                tmp_path,
+            write_config(
                 {
                     "search": {"root_folders": ["."]},
                     "filters": {
@@ -510,6 +629,12 @@ def test_compact_whitespace_trims_trailing_whitespace_on_all_lines():
     expected = "line 1\nline 2\nline 3"
     assert compact_whitespace(text) == expected
 
+def test_compact_whitespace_trim_trailing_only_leaves_carriage_returns():
+    groups = {key: False for key in utils.COMPACT_WHITESPACE_GROUPS}
+    groups["trim_trailing_whitespace"] = True
+    text = "a \r\n\tb\t \n\n c  "
+    assert compact_whitespace(text, groups=groups) == "a \r\n\tb\n\n c"
+
 
 def test_format_size():
     assert format_size(0) == "0.00 B"
@@ -567,10 +692,10 @@ def test_parse_time_value_units(value, expected_delta):
 def test_parse_time_value_unknown_unit_unreachable_branch():
     from unittest.mock import patch, MagicMock
     from utils import parse_time_value
-    with patch('re.match') as mock_match:
+    with patch('utils._RELATIVE_TIME_RE') as mock_pattern:
         mock_m = MagicMock()
         mock_m.group.side_effect = lambda i: "10" if i == 1 else "x"
-        mock_match.side_effect = [None, mock_m]
+        mock_pattern.match.return_value = mock_m
         with pytest.raises(utils.InvalidConfigError) as exc:
             parse_time_value("10x")
         assert "Unknown time unit: 'x'" in str(exc.value)
@@ -661,10 +786,9 @@ def test_validate_glob_pattern_mismatched_brackets(caplog):
         validate_glob_pattern("file[a-z.txt", context="test")
     assert "mismatched brackets" in caplog.text
 
-def test_validate_compact_whitespace_groups_not_dict(tmp_path):
+def test_validate_compact_whitespace_groups_not_dict(write_config):
     """Ensure utils.InvalidConfigError is raised if compact_whitespace_groups is not a dictionary."""
-    config_path = _write_config(
-        tmp_path,
+    config_path = write_config(
         {
             "search": {"root_folders": ["."]},
             "processing": {
@@ -675,10 +799,9 @@ def test_validate_compact_whitespace_groups_not_dict(tmp_path):
     with pytest.raises(utils.InvalidConfigError, match="'processing.compact_whitespace_groups' must be a dictionary"):
         load_and_validate_config(config_path)
 
-def test_validate_compact_whitespace_groups_unknown_key(tmp_path, caplog):
+def test_validate_compact_whitespace_groups_unknown_key(write_config, caplog):
     """Ensure a warning is logged for unknown keys in compact_whitespace_groups."""
-    config_path = _write_config(
-        tmp_path,
+    config_path = write_config(
         {
             "search": {"root_folders": ["."]},
             "processing": {
@@ -693,10 +816,9 @@ def test_validate_compact_whitespace_groups_unknown_key(tmp_path, caplog):
 
     assert "Unknown compact_whitespace_groups entry 'unknown_group'" in caplog.text
 
-def test_validate_compact_whitespace_groups_invalid_value(tmp_path):
+def test_validate_compact_whitespace_groups_invalid_value(write_config):
     """Ensure utils.InvalidConfigError is raised for non-boolean/non-null values in compact_whitespace_groups."""
-    config_path = _write_config(
-        tmp_path,
+    config_path = write_config(
         {
             "search": {"root_folders": ["."]},
             "processing": {
@@ -719,10 +841,9 @@ def test_apply_line_regex_replacements_block_at_eof():
     result = apply_line_regex_replacements(text, rules)
     assert result == "line1\nreplaced"
 
-def test_validate_regex_replacements_invalid_regex(tmp_path):
+def test_validate_regex_replacements_invalid_regex(write_config):
     """Ensure utils.InvalidConfigError is raised for invalid regex in regex_replacements."""
-    config_path = _write_config(
-        tmp_path,
+    config_path = write_config(
         {
             "search": {"root_folders": ["."]},
             "processing": {
@@ -735,10 +856,9 @@ def test_validate_regex_replacements_invalid_regex(tmp_path):
     with pytest.raises(utils.InvalidConfigError, match="Invalid search pattern in processing.regex_replacements\\[0\\]"):
         load_and_validate_config(config_path)
 
-def test_validate_line_regex_replacements_invalid_regex(tmp_path):
+def test_validate_line_regex_replacements_invalid_regex(write_config):
     """Ensure utils.InvalidConfigError is raised for invalid regex in line_regex_replacements."""
-    config_path = _write_config(
-        tmp_path,
+    config_path = write_config(
         {
             "search": {"root_folders": ["."]},
             "processing": {
@@ -751,10 +871,9 @@ def test_validate_line_regex_replacements_invalid_regex(tmp_path):
     with pytest.raises(utils.InvalidConfigError, match="Invalid search pattern in processing.line_regex_replacements\\[0\\]"):
         load_and_validate_config(config_path)
 
-def test_validate_output_format_invalid(tmp_path):
+def test_validate_output_format_invalid(write_config):
     """Ensure utils.InvalidConfigError is raised for an unsupported output format."""
-    config_path = _write_config(
-        tmp_path,
+    config_path = write_config(
         {
             "search": {"root_folders": ["."]},
             "output": {
@@ -765,10 +884,9 @@ def test_validate_output_format_invalid(tmp_path):
     with pytest.raises(utils.InvalidConfigError, match="'output.format' must be one of: text, json, jsonl, markdown, xml"):
         load_and_validate_config(config_path)
 
-def test_validate_processing_compact_whitespace_non_bool(tmp_path):
+def test_validate_processing_compact_whitespace_non_bool(write_config):
     """Ensure utils.InvalidConfigError is raised if processing.compact_whitespace is not a boolean."""
-    config_path = _write_config(
-        tmp_path,
+    config_path = write_config(
         {
             "search": {"root_folders": ["."]},
             "processing": {
@@ -779,10 +897,9 @@ def test_validate_processing_compact_whitespace_non_bool(tmp_path):
     with pytest.raises(utils.InvalidConfigError, match="'processing.compact_whitespace' must be true or false"):
         load_and_validate_config(config_path)
 
-def test_validate_processing_apply_in_place_non_bool(tmp_path):
+def test_validate_processing_apply_in_place_non_bool(write_config):
     """Ensure utils.InvalidConfigError is raised if processing.apply_in_place is not a boolean."""
-    config_path = _write_config(
-        tmp_path,
+    config_path = write_config(
         {
             "search": {"root_folders": ["."]},
             "processing": {
@@ -793,10 +910,9 @@ def test_validate_processing_apply_in_place_non_bool(tmp_path):
     with pytest.raises(utils.InvalidConfigError, match="'processing.apply_in_place' must be true or false"):
         load_and_validate_config(config_path)
 
-def test_validate_output_sort_by_invalid(tmp_path):
+def test_validate_output_sort_by_invalid(write_config):
     """Ensure utils.InvalidConfigError is raised for an unsupported sort_by value."""
-    config_path = _write_config(
-        tmp_path,
+    config_path = write_config(
         {
             "search": {"root_folders": ["."]},
             "output": {
@@ -807,10 +923,22 @@ def test_validate_output_sort_by_invalid(tmp_path):
     with pytest.raises(utils.InvalidConfigError, match="'output.sort_by' must be one of: name, size, modified, tokens, lines, depth, language"):
         load_and_validate_config(config_path)
 
-def test_validate_output_sort_reverse_non_bool(tmp_path):
+def test_validate_output_sort_by_non_string(write_config):
+    """Ensure utils.InvalidConfigError is raised when sort_by is not text."""
+    config_path = write_config(
+        {
+            "search": {"root_folders": ["."]},
+            "output": {
+                "sort_by": ["name"]
+            }
+        }
+    )
+    with pytest.raises(utils.InvalidConfigError, match="'output.sort_by' must be one of"):
+        load_and_validate_config(config_path)
+
+def test_validate_output_sort_reverse_non_bool(write_config):
     """Ensure utils.InvalidConfigError is raised if output.sort_reverse is not a boolean."""
-    config_path = _write_config(
-        tmp_path,
+    config_path = write_config(
         {
             "search": {"root_folders": ["."]},
             "output": {
@@ -821,10 +949,9 @@ def test_validate_output_sort_reverse_non_bool(tmp_path):
     with pytest.raises(utils.InvalidConfigError, match="'output.sort_reverse' must be true or false"):
         load_and_validate_config(config_path)
 
-def test_validate_filters_max_files_invalid(tmp_path):
+def test_validate_filters_max_files_invalid(write_config):
     """Ensure utils.InvalidConfigError is raised if filters.max_files is invalid."""
-    config_path = _write_config(
-        tmp_path,
+    config_path = write_config(
         {
             "search": {"root_folders": ["."]},
             "filters": {
@@ -835,8 +962,7 @@ def test_validate_filters_max_files_invalid(tmp_path):
     with pytest.raises(utils.InvalidConfigError, match="filters.max_files must be 0 or more"):
         load_and_validate_config(config_path)
 
-    config_path = _write_config(
-        tmp_path,
+    config_path = write_config(
         {
             "search": {"root_folders": ["."]},
             "filters": {
@@ -909,6 +1035,36 @@ def test_load_yaml_config_empty(tmp_path):
     with pytest.raises(utils.InvalidConfigError, match="Configuration file is empty or invalid"):
         load_yaml_config(empty_file)
 
+def test_load_yaml_config_reuses_parse_until_file_changes(write_config, monkeypatch):
+    config_path = write_config({"search": {"root_folders": ["a"]}})
+    calls = []
+    parse = utils._parse_yaml_config
+    monkeypatch.setattr(utils, "_parse_yaml_config", lambda path: calls.append(path) or parse(path))
+
+    first = load_yaml_config(config_path)
+    first["search"]["root_folders"].append("mutated")
+    second = load_yaml_config(config_path)
+    assert second == {"search": {"root_folders": ["a"]}}
+    assert len(calls) == 1
+
+    write_config({"search": {"root_folders": ["changed"]}})
+    stat = config_path.stat()
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert load_yaml_config(config_path) == {"search": {"root_folders": ["changed"]}}
+    assert len(calls) == 2
+
+def test_load_yaml_config_cache_follows_working_directory(tmp_path, monkeypatch):
+    for name in ("one", "two"):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "config.yml").write_text(f"name: {name}\n", encoding="utf-8")
+        # Same size and modification time, so only the directory tells them apart
+        os.utime(tmp_path / name / "config.yml", ns=(0, 0))
+
+    monkeypatch.chdir(tmp_path / "one")
+    assert load_yaml_config("config.yml") == {"name": "one"}
+    monkeypatch.chdir(tmp_path / "two")
+    assert load_yaml_config("config.yml") == {"name": "two"}
+
 def test_compact_whitespace_group_none():
     text = "    "
     result = compact_whitespace(text, groups={"spaces_to_tabs": None, "trim_trailing_whitespace": False})
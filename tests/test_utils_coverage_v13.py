@@ -116,7 +116,7 @@ def test_load_yaml_config_no_mark():
     # Covers 212->215 branch (YAMLError without mark)
     from unittest.mock import patch, mock_open
     with patch("builtins.open", mock_open(read_data="key: value")):
-        with patch("yaml.safe_load", side_effect=yaml.YAMLError("General error")):
+        with patch("yaml.load", side_effect=yaml.YAMLError("General error")):
             with pytest.raises(utils.InvalidConfigError):
                 utils.load_yaml_config("dummy.yml")
 
@@ -126,7 +126,7 @@ def test_load_yaml_config_scanner_error_no_quoted_scalar():
     err = ScannerError(context="some context", problem="some problem")
     from unittest.mock import patch, mock_open
     with patch("builtins.open", mock_open(read_data="key: value")):
-        with patch("yaml.safe_load", side_effect=err):
+        with patch("yaml.load", side_effect=err):
             with pytest.raises(utils.InvalidConfigError):
                 utils.load_yaml_config("dummy.yml")
 
@@ -1,10 +1,5 @@
-import sys; import os; from pathlib import Path; sys.path.insert(0, os.fspath(Path(__file__).resolve().parent.parent))
-
 import subprocess
 import sys
-from pathlib import Path
-
-# Ensure repo root is on path
 
 from sourcecombine import __version__
 
@@ -1,12 +1,6 @@
-import sys; import os; from pathlib import Path; sys.path.insert(0, os.fspath(Path(__file__).resolve().parent.parent))
-
-import sys
-from pathlib import Path
 import pytest
 import xml.etree.ElementTree as ET
 
-# Ensure repo root is on path
-
 from sourcecombine import find_and_combine_files
 
 def test_xml_output_filename_with_quotes(tmp_path):
@@ -1,13 +1,24 @@
-import sys; import os; from pathlib import Path; sys.path.insert(0, os.fspath(Path(__file__).resolve().parent.parent))
-
-import sys
-from pathlib import Path
 import xml.etree.ElementTree as ET
 
-# Ensure repo root is on path
-
 from sourcecombine import find_and_combine_files
 
+def _first_file_node(path):
+    """Parse the XML output at ``path`` and return its root tag and first <file> element.
+
+    The document is streamed with ``iterparse`` rather than loaded into a
+    string first. Parsing still runs to the end so the whole output must be
+    valid XML.
+    """
+    root_tag = None
+    file_node = None
+    for event, element in ET.iterparse(path, events=("start", "end")):
+        if event == "start":
+            if root_tag is None:
+                root_tag = element.tag
+        elif element.tag == "file" and file_node is None:
+            file_node = element
+    return root_tag, file_node
+
 def test_xml_output_defaults(tmp_path):
     # Setup
     src_dir = tmp_path / "src"
@@ -39,9 +50,8 @@ def test_xml_output_defaults(tmp_path):
     assert "</repository>" in content
 
     # Verify it's valid XML
-    root = ET.fromstring(content)
-    assert root.tag == "repository"
-    file_node = root.find("file")
+    root_tag, file_node = _first_file_node(output_file)
+    assert root_tag == "repository"
     assert file_node is not None
     assert file_node.attrib["path"] == "a.py"
     assert file_node.text.strip() == "print('a')"
@@ -66,8 +76,7 @@ def test_xml_output_escaping(tmp_path):
     assert "&lt;tag&gt;content &amp; more&lt;/tag&gt;" in content
 
     # Valid XML check
-    root = ET.fromstring(content)
-    file_node = root.find("file")
+    _, file_node = _first_file_node(output_file)
     assert file_node.text.strip() == "<tag>content & more</tag>"
 
 def test_xml_output_overridden_templates(tmp_path):
@@ -121,8 +130,7 @@ def test_xml_output_max_size_placeholder(tmp_path):
     assert "SKIPPED large.txt &amp; more" in content
 
     # Valid XML check
-    root = ET.fromstring(content)
-    file_node = root.find("file")
+    _, file_node = _first_file_node(tmp_path / "output.xml")
     assert file_node.text.strip() == "SKIPPED large.txt & more"
 
 def test_xml_output_with_line_numbers(tmp_path):
@@ -148,7 +156,41 @@ def test_xml_output_with_line_numbers(tmp_path):
     assert "2: line2" in content
 
     # Valid XML check
-    root = ET.fromstring(content)
-    file_node = root.find("file")
+    _, file_node = _first_file_node(output_file)
     assert "1: line1" in file_node.text
     assert "2: line2" in file_node.text
+
+def test_xml_output_escapes_content_larger_than_write_chunk(tmp_path):
+    import sourcecombine
+
+    src_dir = tmp_path / "src"
+    src_dir.mkdir()
+    chunk = sourcecombine._XML_WRITE_CHUNK_SIZE
+    body = "a" * (chunk - 1) + "<&>" + "b" * chunk + "'\""
+    (src_dir / "big.txt").write_text(body, encoding="utf-8")
+
+    output_file = tmp_path / "output.xml"
+
+    config = {
+        'search': {'root_folders': [str(src_dir)]},
+        'output': {'file': str(output_file)},
+        'pairing': {'enabled': False}
+    }
+
+    find_and_combine_files(config, str(output_file), output_format='xml')
+
+    content = output_file.read_text(encoding="utf-8")
+    assert "a&lt;&amp;&gt;b" in content
+
+    _, file_node = _first_file_node(output_file)
+    assert file_node.text.strip() == body
+
+
+def test_xml_attribute_escaping_is_cached():
+    from sourcecombine import _xml_escape_attr, xml_escape
+
+    value = 'dir/"quoted" & <odd>.py'
+    assert _xml_escape_attr(value) == xml_escape(value)
+    hits = _xml_escape_attr.cache_info().hits
+    _xml_escape_attr(value)
+    assert _xml_escape_attr.cache_info().hits == hits + 1
@@ -1,11 +1,15 @@
 import copy
 import json
 import logging
+import os
 import platform
 import re
 import sys
 import urllib.request
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache, partial
+from itertools import compress, count
 from pathlib import Path
 from typing import Any, Mapping, Sequence
 
@@ -16,6 +20,10 @@ try:  # Mandatory dependency for YAML support, but handled gracefully
 except ImportError:
     yaml = None
 
+# Prefer the libyaml-backed loader and dumper when PyYAML was built with them
+_YAML_LOADER = getattr(yaml, "CSafeLoader", None) or getattr(yaml, "SafeLoader", None)
+_YAML_DUMPER = getattr(yaml, "CDumper", None) or getattr(yaml, "Dumper", None)
+
 try:  # Optional tool for accurate token counting
     import tiktoken
 except ImportError:
@@ -304,18 +312,11 @@ class InvalidConfigError(Exception):
     """Raised when the configuration file is invalid."""
 
 
-def load_yaml_config(config_file_path):
-    """Load a YAML configuration file."""
-    if yaml is None:
-        raise InvalidConfigError(
-            "The 'PyYAML' library is required to load YAML configurations. "
-            "Install it with: pip install pyyaml"
-        )
-
-    logging.info("Loading configuration from: %s", config_file_path)
+def _parse_yaml_config(config_file_path):
+    """Parse a YAML configuration file, reporting problems as config errors."""
     try:
         with open(config_file_path, 'r', encoding='utf-8') as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=_YAML_LOADER)
             if config is None:
                 raise InvalidConfigError("Configuration file is empty or invalid.")
             return config
@@ -345,6 +346,41 @@ def load_yaml_config(config_file_path):
         raise InvalidConfigError(message) from e
 
 
+@lru_cache(maxsize=16)
+def _parse_yaml_config_cached(config_file_path, mtime_ns, size):
+    """Parse a configuration file once per version (modification time and size).
+
+    ``config_file_path`` is absolute so relative paths stay unambiguous when
+    the working directory changes.
+    """
+    return _parse_yaml_config(config_file_path)
+
+
+def load_yaml_config(config_file_path):
+    """Load a YAML configuration file.
+
+    Parsed files are cached until they change; every call returns its own
+    copy, so callers may modify the result.
+    """
+    if yaml is None:
+        raise InvalidConfigError(
+            "The 'PyYAML' library is required to load YAML configurations. "
+            "Install it with: pip install pyyaml"
+        )
+
+    logging.info("Loading configuration from: %s", config_file_path)
+    try:
+        st = Path(config_file_path).stat()
+    except (OSError, TypeError, ValueError):
+        # Let the parser report missing or unreadable files
+        return _parse_yaml_config(config_file_path)
+    return copy.deepcopy(
+        _parse_yaml_config_cached(
+            os.path.abspath(config_file_path), st.st_mtime_ns, st.st_size
+        )
+    )
+
+
 def save_yaml_config(config_file_path, config):
     """Save a dictionary to a YAML configuration file."""
     if yaml is None:
@@ -357,27 +393,94 @@ def save_yaml_config(config_file_path, config):
     try:
         with open(config_file_path, 'w', encoding='utf-8') as f:
             f.write("# SourceCombine Configuration\n")
-            yaml.dump(config, f, sort_keys=False)
+            yaml.dump(config, f, Dumper=_YAML_DUMPER, sort_keys=False)
     except OSError as e:
         raise InvalidConfigError(f"Could not write configuration file: {e}") from e
 
 
-def _decode_best_effort(raw_bytes: bytes, source_label: str) -> tuple[str, str]:
+# Number of leading bytes analyzed when guessing the encoding of non-UTF-8 data
+_ENCODING_SAMPLE_SIZE = 4096
+
+
+def _guess_encoding(raw_bytes: bytes):
+    """Return the best charset-normalizer match for ``raw_bytes``.
+
+    Only the first ``_ENCODING_SAMPLE_SIZE`` bytes are analyzed. If the guess
+    cannot decode the whole buffer, the full data is analyzed instead.
+    """
+    if len(raw_bytes) <= _ENCODING_SAMPLE_SIZE:
+        return from_bytes(raw_bytes).best()
+
+    best_guess = from_bytes(raw_bytes[:_ENCODING_SAMPLE_SIZE]).best()
+    if best_guess and best_guess.encoding:
+        try:
+            raw_bytes.decode(best_guess.encoding)
+            return best_guess
+        except (UnicodeDecodeError, LookupError):
+            pass
+    return from_bytes(raw_bytes).best()
+
+
+# Encodings detected for files during this run, keyed by ``_encoding_cache_key``.
+# Files are often read more than once (filtering, then combining), and this
+# avoids running charset detection on the same unchanged bytes again.
+_DETECTED_ENCODINGS = {}
+
+
+def _encoding_cache_key(file_path: str | Path, raw_bytes: bytes) -> tuple | None:
+    """Return a key that identifies the current contents of ``file_path``."""
+    try:
+        path = Path(file_path)
+        st = path.stat()
+    except (OSError, TypeError, ValueError):
+        return None
+    if st.st_size != len(raw_bytes):
+        # The file changed after it was read
+        return None
+    return (str(path.absolute()), st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+_UNICODE_BOMS = (
+    (b'\xff\xfe\x00\x00', 'utf_32'),
+    (b'\x00\x00\xfe\xff', 'utf_32'),
+    (b'\xff\xfe', 'utf_16'),
+    (b'\xfe\xff', 'utf_16'),
+)
+
+
+def _decode_best_effort(raw_bytes: bytes, source_label: str, file_path: str | Path | None = None) -> tuple[str, str]:
     """Identify and apply the best character encoding for the provided bytes.
 
+    When ``file_path`` is given, the detected encoding is remembered for that
+    file until its size or modification time changes.
+
     Returns a tuple of (decoded_text, encoding_name).
     """
-    try:
-        text = raw_bytes.decode('utf-8-sig')
-        if '\x00' in text:
-            raise UnicodeError("Found empty (NUL) characters; trying fallback detection.")
-        # Only return utf-8-sig if it actually had a BOM
-        encoding = 'utf-8-sig' if raw_bytes.startswith(b'\xef\xbb\xbf') else 'utf-8'
-        return text, encoding
-    except UnicodeError:
-        pass
+    # Empty (NUL) bytes point to UTF-16/32 or binary data, so those go straight
+    # to detection instead of being decoded as UTF-8 first. In UTF-8 a NUL
+    # byte only ever encodes a NUL character.
+    if b'\x00' not in raw_bytes:
+        try:
+            text = raw_bytes.decode('utf-8-sig')
+            # Only return utf-8-sig if it actually had a BOM
+            encoding = 'utf-8-sig' if raw_bytes.startswith(b'\xef\xbb\xbf') else 'utf-8'
+            return text, encoding
+        except UnicodeDecodeError:
+            pass
+
+    # A UTF-32/UTF-16 byte order mark settles the encoding without detection.
+    # UTF-32 is checked first because its little-endian BOM starts with the
+    # UTF-16 one.
+    for bom, encoding in _UNICODE_BOMS:
+        if raw_bytes.startswith(bom):
+            return raw_bytes.decode(encoding, errors='replace').lstrip('\ufeff'), encoding
 
-    best_guess = from_bytes(raw_bytes).best()
+    cache_key = _encoding_cache_key(file_path, raw_bytes) if file_path is not None else None
+    cached_encoding = _DETECTED_ENCODINGS.get(cache_key) if cache_key else None
+    if cached_encoding:
+        return raw_bytes.decode(cached_encoding, errors='replace').lstrip('\ufeff'), cached_encoding
+
+    best_guess = _guess_encoding(raw_bytes)
     if best_guess and best_guess.encoding:
         encoding = best_guess.encoding
         if encoding.lower().replace('-', '_').startswith('utf_16'):
@@ -387,7 +490,10 @@ def _decode_best_effort(raw_bytes: bytes, source_label: str) -> tuple[str, str]:
                 # Guard against spurious UTF-16 guesses on very small files
                 encoding = 'latin-1'
         try:
-            return raw_bytes.decode(encoding, errors='replace').lstrip('\ufeff'), encoding
+            text = raw_bytes.decode(encoding, errors='replace').lstrip('\ufeff')
+            if cache_key:
+                _DETECTED_ENCODINGS[cache_key] = encoding
+            return text, encoding
         except LookupError:
             logging.warning(
                 "Detected encoding '%s' is not supported for %s.", encoding, source_label
@@ -400,6 +506,29 @@ def _decode_best_effort(raw_bytes: bytes, source_label: str) -> tuple[str, str]:
     return raw_bytes.decode('utf-8', errors='replace').lstrip('\ufeff'), 'utf-8'
 
 
+def _read_file_bytes(file_path: str | Path) -> bytes:
+    """Return the raw contents of ``file_path``.
+
+    Reads with ``os.open``/``os.read`` sized from ``os.fstat``, which skips
+    the buffered file object that ``open()`` or ``Path.read_bytes`` set up.
+    """
+    fd = os.open(file_path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    try:
+        size = os.fstat(fd).st_size
+        data = os.read(fd, size + 1)
+        if len(data) == size:
+            return data
+        # Short read, a file that grew, or a special file without a size
+        chunks = [data]
+        while True:
+            chunk = os.read(fd, 64 * 1024)
+            if not chunk:
+                return b"".join(chunks)
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+
+
 def read_file_best_effort(file_path: str | Path) -> tuple[str, str]:
     """Attempt to read a file using multiple methods.
 
@@ -411,8 +540,8 @@ def read_file_best_effort(file_path: str | Path) -> tuple[str, str]:
         (str, str): The text content and the name of its encoding.
     """
     try:
-        raw_bytes = Path(file_path).read_bytes()
-        return _decode_best_effort(raw_bytes, str(file_path))
+        raw_bytes = _read_file_bytes(file_path)
+        return _decode_best_effort(raw_bytes, str(file_path), file_path=file_path)
     except FileNotFoundError:
         raise
     except OSError:
@@ -420,6 +549,21 @@ def read_file_best_effort(file_path: str | Path) -> tuple[str, str]:
         return "", 'utf-8'
 
 
+def read_files_best_effort(
+    file_paths: Sequence[str | Path], max_workers: int = 8
+) -> list[tuple[str, str]]:
+    """Read several files with :func:`read_file_best_effort` concurrently.
+
+    Reads overlap on a small thread pool so disk latency is not paid one file
+    at a time. Results are returned in the same order as ``file_paths``.
+    """
+    file_paths = list(file_paths)
+    if len(file_paths) < 2 or max_workers < 2:
+        return [read_file_best_effort(path) for path in file_paths]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(file_paths))) as executor:
+        return list(executor.map(read_file_best_effort, file_paths))
+
+
 def parse_ignore_file(file_path: str | Path) -> list[str]:
     """Read an ignore file and return a list of non-empty patterns.
 
@@ -490,6 +634,26 @@ def _looks_binary(
     return (non_text_control / len(sample)) > 0.30
 
 
+@lru_cache(maxsize=None)
+def _comment_patterns(lang):
+    """Return compiled (multi-line, single-line, trailing) patterns for ``lang``."""
+    single_prefix, multi_start, multi_end = LANG_TO_COMMENT_STYLE[lang]
+    multi_re = single_re = trailing_re = None
+    if multi_start and multi_end:
+        # Non-greedy dotall match to find all comment blocks
+        multi_re = re.compile(
+            re.escape(multi_start) + r'.*?' + re.escape(multi_end), re.DOTALL
+        )
+    if single_prefix:
+        single_re = re.compile(
+            r'^[ \t]*' + re.escape(single_prefix) + r'.*$', re.MULTILINE
+        )
+        trailing_re = re.compile(
+            r'[ \t]+' + re.escape(single_prefix) + r'.*$', re.MULTILINE
+        )
+    return multi_re, single_re, trailing_re
+
+
 def remove_comments_by_lang(text, lang, single_only=False, multi_only=False):
     """Remove comments from text based on the language style.
 
@@ -507,31 +671,38 @@ def remove_comments_by_lang(text, lang, single_only=False, multi_only=False):
     if not text or not lang or lang not in LANG_TO_COMMENT_STYLE:
         return text
 
-    single_prefix, multi_start, multi_end = LANG_TO_COMMENT_STYLE[lang]
+    multi_re, single_re, trailing_re = _comment_patterns(lang)
 
     # Handle multi-line comments first to avoid them being partially
     # matched by single-line prefix rules.
-    if multi_start and multi_end and not single_only:
-        # We use a non-greedy dotall match to find all comment blocks.
-        pattern = re.escape(multi_start) + r'.*?' + re.escape(multi_end)
-        text = re.sub(pattern, '', text, flags=re.DOTALL)
+    if multi_re is not None and not single_only:
+        text = multi_re.sub('', text)
 
-    if single_prefix and not multi_only:
+    if single_re is not None and not multi_only:
         # Match from prefix to end of line, being careful not to match
         # prefixes inside strings or already within multi-line comments.
         # This is a basic implementation; robust comment removal usually
         # requires a proper lexer, but this works for most common cases.
-        pattern = r'^[ \t]*' + re.escape(single_prefix) + r'.*$'
-        text = re.sub(pattern, '', text, flags=re.MULTILINE)
+        text = single_re.sub('', text)
 
         # Also try to catch trailing comments, but only if they are preceded by whitespace
         # to reduce the risk of matching markers inside strings.
-        trailing_pattern = r'[ \t]+' + re.escape(single_prefix) + r'.*$'
-        text = re.sub(trailing_pattern, '', text, flags=re.MULTILINE)
+        text = trailing_re.sub('', text)
 
     return text
 
 
+# Patterns used by ``compact_whitespace``, in the order they are applied
+# Drops spaces before any tab and, for a tab that follows other text, the spaces
+# after it too; one pass with the same result as ' +\t' then '(?<=[^\n\t])\t +'
+_SPACES_AROUND_TAB_RE = re.compile(r'(?=[ \t])(?:(?<=[^\n\t ]) *\t +| +\t)')
+_SPACES_AFTER_INDENT_RE = re.compile(r'^(\t+) +(?=\S)', re.MULTILINE)
+_TAB_SPACE_RUN_RE = re.compile(r'\t {2,}(?=\s|$)')
+_MID_LINE_TABS_RE = re.compile(r'(?<=[^\n\t])\t+')
+_BLANK_LINE_RUN_RE = re.compile(r'\n{3,}')
+_SPACE_RUN_RE = re.compile(r' {3,}')
+
+
 def compact_whitespace(text, *, groups=None):
     """Compact and normalize whitespace within ``text``.
 
@@ -561,23 +732,24 @@ def compact_whitespace(text, *, groups=None):
             return True
         return bool(value)
 
-    if _should_apply('normalize_line_endings'):
+    if _should_apply('normalize_line_endings') and '\r' in text:
         text = text.replace('\r\n', '\n').replace('\r', '\n')
-    if _should_apply('spaces_to_tabs'):
-        text = re.sub(r' {4}', '\t', text)
-    if _should_apply('trim_spaces_around_tabs'):
-        text = re.sub(r' +\t', '\t', text)
-        text = re.sub(r'(?<=[^\n\t])\t +', '\t', text)
-        text = re.sub(r'^(\t+) +(?=\S)', r'\1', text, flags=re.MULTILINE)
-        text = re.sub(r'\t {2,}(?=\s|$)', '\t ', text)
-    if _should_apply('replace_mid_line_tabs'):
-        text = re.sub(r'(?<=[^\n\t])\t+', ' ', text)
-    if _should_apply('trim_trailing_whitespace'):
-        text = re.sub(r'[ \t]+$', '', text, flags=re.MULTILINE)
-    if _should_apply('compact_blank_lines'):
-        text = re.sub(r'\n{3,}', '\n\n', text)
-    if _should_apply('compact_space_runs'):
-        text = re.sub(r' {3,}', '  ', text)
+    if _should_apply('spaces_to_tabs') and '    ' in text:
+        text = text.replace('    ', '\t')
+    if _should_apply('trim_spaces_around_tabs') and '\t' in text:
+        text = _SPACES_AROUND_TAB_RE.sub('\t', text)
+        text = _SPACES_AFTER_INDENT_RE.sub(r'\1', text)
+        text = _TAB_SPACE_RUN_RE.sub('\t ', text)
+    if _should_apply('replace_mid_line_tabs') and '\t' in text:
+        text = _MID_LINE_TABS_RE.sub(' ', text)
+    if _should_apply('trim_trailing_whitespace') and (
+        ' \n' in text or '\t\n' in text or text.endswith((' ', '\t'))
+    ):
+        text = '\n'.join([line.rstrip(' \t') for line in text.split('\n')])
+    if _should_apply('compact_blank_lines') and '\n\n\n' in text:
+        text = _BLANK_LINE_RUN_RE.sub('\n\n', text)
+    if _should_apply('compact_space_runs') and '   ' in text:
+        text = _SPACE_RUN_RE.sub('  ', text)
     return text
 
 
@@ -623,30 +795,44 @@ def _validate_regex_list(rules, context_prefix, source):
             )
 
 
-def _replace_line_block(text, regex, replacement=None):
-    """Collapse blocks of lines matching ``regex`` into ``replacement``.
+def _collapse_line_blocks(lines, regex, replacement=None):
+    """Return ``lines`` with each block of lines matching ``regex`` collapsed.
 
     ``regex`` should be a compiled search pattern that matches an entire
     line. Lines that follow each other and match are treated as a single block.
     If ``replacement`` is ``None`` the block is simply removed; otherwise
-    ``replacement`` is inserted once for each block.
+    ``replacement`` is inserted once for each block. ``lines`` itself is
+    returned when nothing matches.
     """
-    lines = text.splitlines()
+    # Indexes of the matching lines; the lines between blocks are copied as slices
+    hits = list(compress(count(), map(regex.match, lines)))
+    if not hits:
+        return lines
+
     out_lines = []
-    in_block = False
-    for line in lines:
-        if regex.match(line):
-            in_block = True
-            continue
-        if in_block:
-            if replacement is not None:
+    start = 0
+    block_end = None
+    for i in hits:
+        if i != block_end:
+            if block_end is not None and replacement is not None:
                 out_lines.append(replacement)
-            in_block = False
-        out_lines.append(line)
-    if in_block:
-        if replacement is not None:
-            out_lines.append(replacement)
+            out_lines.extend(lines[start:i])
+        block_end = start = i + 1
+    if replacement is not None:
+        out_lines.append(replacement)
+    out_lines.extend(lines[start:])
+    return out_lines
+
 
+def _replace_line_block(text, regex, replacement=None):
+    """Apply :func:`_collapse_line_blocks` to ``text`` as a whole.
+
+    Splits ``text`` into lines and joins the result, keeping a trailing
+    newline. ``apply_line_regex_replacements`` works on the line list
+    directly; this text-level form is kept for the tests, which use it as
+    the one-rule reference.
+    """
+    out_lines = _collapse_line_blocks(text.splitlines(), regex, replacement)
     result = "\n".join(out_lines)
     if text.endswith("\n") and out_lines:
         result += "\n"
@@ -953,6 +1139,14 @@ def _validate_project_section(config):
             raise InvalidConfigError(f"'project.{field}' must be text or nothing.")
 
 
+_VALID_OUTPUT_FORMATS = frozenset(
+    {'text', 'json', 'jsonl', 'markdown', 'xml', 'manifest', 'csv'}
+)
+_VALID_SORT_KEYS = frozenset(
+    {'name', 'size', 'modified', 'tokens', 'lines', 'depth', 'language'}
+)
+
+
 def _validate_output_section(config):
     """Validate the 'output' section of the configuration."""
 
@@ -990,11 +1184,11 @@ def _validate_output_section(config):
         )
 
     fmt = output_conf.get('format')
-    if fmt is not None and fmt not in ('text', 'json', 'jsonl', 'markdown', 'xml', 'manifest', 'csv'):
+    if fmt is not None and fmt not in _VALID_OUTPUT_FORMATS:
         raise InvalidConfigError("'output.format' must be one of: text, json, jsonl, markdown, xml, manifest, csv")
 
     sort_by = output_conf.get('sort_by')
-    if sort_by is not None and sort_by not in ('name', 'size', 'modified', 'tokens', 'lines', 'depth', 'language'):
+    if sort_by is not None and (not isinstance(sort_by, str) or sort_by not in _VALID_SORT_KEYS):
         raise InvalidConfigError(
             "'output.sort_by' must be one of: name, size, modified, tokens, lines, depth, language"
         )
@@ -1009,21 +1203,94 @@ def _validate_output_section(config):
 def apply_line_regex_replacements(text, rules):
     """Apply line-oriented regex replacements.
 
-    Each rule in ``rules`` must provide a ``pattern`` key. If ``replacement``
-    is supplied, it is inserted once for each contiguous block of matching
-    lines; otherwise matching lines are removed. Rules are applied
-    sequentially.
+    Each rule in ``rules`` must provide a ``pattern`` key, either as text or
+    as an already compiled search pattern. If ``replacement`` is supplied, it
+    is inserted once for each contiguous block of matching lines; otherwise
+    matching lines are removed. Rules are applied sequentially.
     """
+    # The text is split once and every rule works on the list of lines. The
+    # list and ``trailing_newline`` are kept equal to what splitting the joined
+    # result again would give, so the output matches applying each rule to
+    # the text in turn.
+    lines = None
+    trailing_newline = False
     for rule in rules or []:
         pattern = rule.get('pattern')
         if not pattern:
             continue
         replacement = rule.get('replacement')
-        compiled = validate_regex_pattern(
-            pattern, context="processing.line_regex_replacements"
-        )
-        text = _replace_line_block(text, compiled, replacement)
-    return text
+        if isinstance(pattern, re.Pattern):
+            compiled = pattern
+        else:
+            compiled = validate_regex_pattern(
+                pattern, context="processing.line_regex_replacements"
+            )
+        if lines is None:
+            lines = text.splitlines()
+            trailing_newline = text.endswith("\n")
+        lines = _collapse_line_blocks(lines, compiled, replacement)
+
+        if replacement is not None and len((replacement + "x").splitlines()) > 1:
+            # The replacement spans several lines; join now and let the next
+            # rule split the text again
+            text = "\n".join(lines)
+            if trailing_newline and lines:
+                text += "\n"
+            lines = None
+        elif not trailing_newline and lines and not lines[-1]:
+            # A final empty line without a trailing newline joins to text that
+            # ends in one
+            lines = lines[:-1]
+            trailing_newline = bool(lines)
+
+    if lines is None:
+        return text
+    result = "\n".join(lines)
+    if trailing_newline and lines:
+        result += "\n"
+    return result
+
+
+_SCALAR_DEFAULT_TYPES = (str, int, float, type(None))
+
+
+def _copy_default(value):
+    """Return a copy of a default value that is safe to store in a config.
+
+    Copies prevent shared references to mutable defaults (lists/dicts)
+    polluting the global DEFAULT_CONFIG when the config is modified later.
+    Text and numbers are shared as-is and lists of them are copied
+    shallowly; only other values need the cost of ``copy.deepcopy``.
+    """
+    if isinstance(value, _SCALAR_DEFAULT_TYPES):
+        return value
+    if isinstance(value, list) and all(isinstance(item, _SCALAR_DEFAULT_TYPES) for item in value):
+        return list(value)
+    return copy.deepcopy(value)
+
+
+def _flatten_defaults(defaults):
+    """Return the sections of ``defaults`` as a flat tuple, parents first.
+
+    Each item is ``(path, entries)``: ``path`` holds the keys leading to a
+    section and ``entries`` holds ``(key, value, is_section)`` for every key
+    in it, in order. Applying sections in this order fills a configuration
+    the same way as walking ``defaults`` recursively.
+    """
+    sections = []
+    pending = [((), defaults)]
+    for path, defs in pending:
+        entries = []
+        for key, value in defs.items():
+            is_section = isinstance(value, dict)
+            entries.append((key, value, is_section))
+            if is_section:
+                pending.append((path + (key,), value))
+        sections.append((path, tuple(entries)))
+    return tuple(sections)
+
+
+_DEFAULT_CONFIG_SECTIONS = _flatten_defaults(DEFAULT_CONFIG)
 
 
 def validate_config(
@@ -1050,20 +1317,22 @@ def validate_config(
             )
 
     if defaults:
-        def apply_defaults(cfg, defs):
-            for key, value in defs.items():
-                if isinstance(value, dict):
-                    if key not in cfg or cfg[key] is None:
-                        cfg[key] = {}
-                    node = cfg[key]
-                    if isinstance(node, dict):
-                        apply_defaults(node, value)
-                elif key not in cfg or cfg[key] is None:
-                    # Use deepcopy to prevent shared references to mutable defaults (lists/dicts)
-                    # polluting the global DEFAULT_CONFIG when 'cfg' is modified later.
-                    cfg[key] = copy.deepcopy(value)
-
-        apply_defaults(config, defaults)
+        if defaults is DEFAULT_CONFIG:
+            sections = _DEFAULT_CONFIG_SECTIONS
+        else:
+            sections = _flatten_defaults(defaults)
+        for path, entries in sections:
+            node = config
+            for key in path:
+                node = node[key]
+                if not isinstance(node, dict):
+                    # Leave sections the user set to something else for
+                    # validation to report
+                    break
+            else:
+                for key, value, is_section in entries:
+                    if node.get(key) is None:
+                        node[key] = {} if is_section else _copy_default(value)
 
     if nested_required:
         for key, subkeys in nested_required.items():
@@ -1109,6 +1378,58 @@ def load_and_validate_config(
     return config
 
 
+# Matches the same characters as str.strip() with no arguments
+_WHITESPACE_RUN_RE = re.compile(r'\s*')
+
+
+_C_STYLE_COMMENT_RE = re.compile(r'/\*.*?\*/', re.DOTALL)
+
+
+def _remove_c_style_comments(text):
+    """Remove every ``/* ... */`` block, leaving an unterminated ``/*`` as is.
+
+    Only the text up to the last ``*/`` can hold a complete comment, so the
+    pattern is not run over the tail, where each ``/*`` would otherwise be
+    scanned to the end of the text without finding a match.
+    """
+    end = text.rfind('*/')
+    if end == -1:
+        return text
+    end += 2
+    return _C_STYLE_COMMENT_RE.sub('', text[:end]) + text[end:]
+
+
+def compile_options(options):
+    """Return a copy of processing ``options`` with rule patterns compiled.
+
+    Pass the result to :func:`process_content` when many files share the same
+    options, so the rules are not looked up and checked again for every file.
+    Invalid patterns raise ``InvalidConfigError`` here instead of on the
+    first file.
+    """
+    if not options:
+        return options
+    compiled = dict(options)
+    for key in ('regex_replacements', 'line_regex_replacements'):
+        rules = options.get(key)
+        if not rules:
+            continue
+        compiled_rules = []
+        for rule in rules:
+            pattern = rule.get('pattern')
+            # Only compile rules that process_content would use
+            if key == 'regex_replacements':
+                usable = pattern is not None and rule.get('replacement') is not None
+            else:
+                usable = bool(pattern)
+            if usable and not isinstance(pattern, re.Pattern):
+                rule = dict(rule)
+                rule['pattern'] = validate_regex_pattern(pattern, context=f"processing.{key}")
+            compiled_rules.append(rule)
+        compiled[key] = compiled_rules
+    return compiled
+
+
 def process_content(buffer: str, options: Mapping[str, Any], language: str | None = None) -> str:
     """Process text based on a dictionary of options.
 
@@ -1130,19 +1451,22 @@ def process_content(buffer: str, options: Mapping[str, Any], language: str | Non
       ``COMPACT_WHITESPACE_GROUPS``.
     - ``max_lines`` (int): if greater than zero, shorten the output to this many lines.
     - ``max_tokens`` (int): if greater than zero, shorten the output to this many tokens.
+
+    Rule patterns may already be compiled; see :func:`compile_options`.
     """
     if not options:
         return buffer
 
     if options.get('remove_initial_c_style_comment'):
-        stripped = buffer.lstrip()
-        if stripped.startswith('/*'):
-            end_index = stripped.find('*/', 2)
+        # Work with offsets so the buffer is only copied once, when a comment is removed
+        start = _WHITESPACE_RUN_RE.match(buffer).end()
+        if buffer.startswith('/*', start):
+            end_index = buffer.find('*/', start + 2)
             if end_index != -1:
-                buffer = stripped[end_index + 2:].lstrip()
+                buffer = buffer[_WHITESPACE_RUN_RE.match(buffer, end_index + 2).end():]
 
     if options.get('remove_all_c_style_comments'):
-        buffer = re.sub(r'/\*.*?\*/', '', buffer, flags=re.DOTALL)
+        buffer = _remove_c_style_comments(buffer)
 
     if language and (options.get('remove_comments') or options.get('remove_single_line_comments')):
         single_only = bool(options.get('remove_single_line_comments') and not options.get('remove_comments'))
@@ -1154,9 +1478,12 @@ def process_content(buffer: str, options: Mapping[str, Any], language: str | Non
         replacement = rule.get('replacement')
         if pattern is None or replacement is None:
             continue
-        compiled = validate_regex_pattern(
-            pattern, context="processing.regex_replacements"
-        )
+        if isinstance(pattern, re.Pattern):
+            compiled = pattern
+        else:
+            compiled = validate_regex_pattern(
+                pattern, context="processing.regex_replacements"
+            )
         regex_rules.append((compiled, replacement))
 
     for compiled, replacement in regex_rules:
@@ -1269,6 +1596,70 @@ def get_language_tag(path: str | Path, content: str | None = None, overrides: Ma
     return ext.lstrip('.') or "text"
 
 
+# Below this many files, starting worker processes costs more than it saves
+_PARALLEL_PROCESS_MIN_FILES = 64
+# Each worker re-imports the modules (and tiktoken), so keep the default pool small
+_DEFAULT_PROCESS_WORKERS = 8
+# ProcessPoolExecutor rejects more than 61 workers on Windows
+_WINDOWS_MAX_PROCESS_WORKERS = 61
+
+
+def _read_and_measure(file_path, options, metric, overrides=None):
+    content, _ = read_file_best_effort(file_path)
+    language = get_language_tag(file_path, content=content, overrides=overrides)
+    processed = process_content(content, options, language=language)
+    if metric == 'tokens':
+        return estimate_tokens(processed)[0]
+    return count_lines(processed)
+
+
+def _available_cpu_count():
+    """Return how many CPUs this process may run on (affinity-aware)."""
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0)) or 1
+    return os.cpu_count() or 1
+
+
+def measure_files(file_paths, metric, options, *, overrides=None, workers=None):
+    """Yield the token or line count of each processed file, in order.
+
+    Each file is read, tagged with its language, and passed through
+    :func:`process_content`; ``metric`` is ``'tokens'`` or ``'lines'``.
+    Large batches are spread over worker processes that return only the
+    counts. ``workers`` defaults to the usable CPU count, capped at
+    ``_DEFAULT_PROCESS_WORKERS``; ``1`` keeps everything in this process, as
+    does a host without multiprocessing support.
+    """
+    file_paths = list(file_paths)
+    measure_one = partial(
+        _read_and_measure, options=options, metric=metric, overrides=overrides
+    )
+    if workers is None:
+        workers = min(_available_cpu_count(), _DEFAULT_PROCESS_WORKERS)
+    if sys.platform == 'win32':
+        workers = min(workers, _WINDOWS_MAX_PROCESS_WORKERS)
+    workers = min(workers, len(file_paths))
+    if workers < 2 or len(file_paths) < _PARALLEL_PROCESS_MIN_FILES:
+        yield from map(measure_one, file_paths)
+        return
+
+    chunksize = max(1, len(file_paths) // (4 * workers))
+    executor = None
+    try:
+        executor = ProcessPoolExecutor(max_workers=workers)
+        results = executor.map(measure_one, file_paths, chunksize=chunksize)
+    except (OSError, NotImplementedError, ValueError):
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+        yield from map(measure_one, file_paths)
+        return
+    try:
+        yield from results
+    finally:
+        # Drop queued chunks when the caller stops early
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
 def get_all_languages() -> list[str]:
     """Return a sorted list of all unique supported language identifiers."""
     all_langs = set(EXTENSION_TO_LANG.values())
@@ -1281,13 +1672,29 @@ def count_lines(text: str) -> int:
     return len(text.splitlines())
 
 
+# Number of "N: " prefixes built once and shared by ``add_line_numbers``
+_LINE_NUMBER_PREFIX_COUNT = 10000
+
+
+@lru_cache(maxsize=1)
+def _line_number_prefixes():
+    """Return the prefixes for the first ``_LINE_NUMBER_PREFIX_COUNT`` lines."""
+    return tuple(f"{i}: " for i in range(1, _LINE_NUMBER_PREFIX_COUNT + 1))
+
+
 def add_line_numbers(text):
     """Prepend line numbers to each line of text."""
     lines = text.splitlines()
-    numbered = [f"{i + 1}: {line}" for i, line in enumerate(lines)]
+    prefixes = _line_number_prefixes()
+    if len(lines) > len(prefixes):
+        prefixes += tuple(f"{i}: " for i in range(len(prefixes) + 1, len(lines) + 1))
+    result = "\n".join(map(str.__add__, prefixes, lines))
     if text.endswith("\n"):
-        numbered.append("")
-    return "\n".join(numbered)
+        result += "\n"
+    return result
+
+
+_LINE_NUMBER_PREFIX_RE = re.compile(r"^\s*\d+:\s")
 
 
 def remove_line_numbers(text):
@@ -1301,7 +1708,7 @@ def remove_line_numbers(text):
     if not lines:
         return text
 
-    pattern = re.compile(r"^\s*\d+:\s")
+    pattern = _LINE_NUMBER_PREFIX_RE
     matches = 0
     non_empty_lines = 0
 
@@ -1323,6 +1730,9 @@ def remove_line_numbers(text):
     return text
 
 
+_REPEATED_SLASHES_RE = re.compile(r'/+')
+
+
 def validate_glob_pattern(pattern, *, context="file pattern"):
     """Warn about potentially problematic search patterns."""
     if not isinstance(pattern, str):
@@ -1339,7 +1749,7 @@ def validate_glob_pattern(pattern, *, context="file pattern"):
         )
         normalized = pattern.replace('\\', '/')
 
-    normalized = re.sub(r'/+', '/', normalized)
+    normalized = _REPEATED_SLASHES_RE.sub('/', normalized)
 
     if Path(normalized).is_absolute():
         logging.warning(
@@ -1369,16 +1779,23 @@ def validate_glob_pattern(pattern, *, context="file pattern"):
     return normalized
 
 
+@lru_cache(maxsize=1024)
+def _compile_regex(pattern, flags=0):
+    """Compile ``pattern`` once and reuse the result for later calls."""
+    return re.compile(pattern, flags)
+
+
 def validate_regex_pattern(pattern, *, context="search pattern", source=None):
     """Return a compiled search pattern after validating ``pattern``.
 
     Raises ``InvalidConfigError`` with a helpful message when ``pattern`` is
     invalid. ``context`` describes where the pattern originated so the error
-    can guide the user to the right configuration entry.
+    can guide the user to the right configuration entry. Compiled patterns
+    are cached, so the same rule is only compiled once per run.
     """
 
     try:
-        return re.compile(pattern)
+        return _compile_regex(pattern)
     except re.error as exc:
         location = f"Invalid search pattern in {context}"
         if source:
@@ -1447,6 +1864,10 @@ def format_tokens(count: int, is_approx: bool = False) -> str:
     return f"{'~' if is_approx else ''}{count:,}"
 
 
+_ISO_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+_RELATIVE_TIME_RE = re.compile(r'^(\d+)([smhdw])$')
+
+
 def parse_time_value(value: str) -> float:
     """Convert a time such as '1h' or '2023-01-01' into a number the computer can use.
 
@@ -1462,7 +1883,7 @@ def parse_time_value(value: str) -> float:
     value = value.lower().strip()
 
     # Try absolute date YYYY-MM-DD
-    if re.match(r'^\d{4}-\d{2}-\d{2}$', value):
+    if _ISO_DATE_RE.match(value):
         try:
             dt = datetime.strptime(value, '%Y-%m-%d')
             return dt.timestamp()
@@ -1470,7 +1891,7 @@ def parse_time_value(value: str) -> float:
             raise InvalidConfigError(f"Invalid date format: '{value}'. Use YYYY-MM-DD.")
 
     # Try relative durations
-    match = re.match(r'^(\d+)([smhdw])$', value)
+    match = _RELATIVE_TIME_RE.match(value)
     if match:
         amount = int(match.group(1))
         unit = match.group(2)
@@ -1499,6 +1920,9 @@ def parse_time_value(value: str) -> float:
     )
 
 
+_SIZE_VALUE_RE = re.compile(r'^([\d.]+)\s*([A-Z]*)$')
+
+
 def parse_size_value(value: str) -> int:
     """Convert a human-readable size such as '10KB' or '1.5MB' into bytes.
 
@@ -1508,7 +1932,7 @@ def parse_size_value(value: str) -> int:
         return 0
 
     value = value.strip().upper().replace(',', '').lstrip('~').strip()
-    match = re.match(r'^([\d.]+)\s*([A-Z]*)$', value)
+    match = _SIZE_VALUE_RE.match(value)
     if not match:
         raise InvalidConfigError(f"Invalid size value: '{value}'. Use '10KB', '1.5MB', and similar units.")
 